@@ -0,0 +1,467 @@
+# Columns of every Url_Paths category as plain data. The literal compiles to constants of this module's bytecode,
+# aggregate turns a category's entries into Django fields and parsers only when they are first asked for.
+#
+# "django_model" is (field, options) or None for columns that are not stored. Every column is blank and null, "min"
+# and "max_years_ahead" become validators and "base_field" is the element field of an ArrayField.
+# "parser" is (kind, arguments...). A choice is (value, condition) where a condition is a substring, {"pattern": regex},
+# {"unqualified": regex} for group 2 when group 1 did not match, or a tuple of conditions any of which may match.
+SCHEMA = {
+    "APPROACH_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": None, "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 32, "choices": (("tongue pull loop", "Tongue Pull Loop"), ("expensive", "Expensive"), ("cheap", "Cheap"), ("lightweight", "Lightweight"), ("heel brake", "Heel Brake"), ("breathable", "Breathable"))})}), "parser": ("tag", ("Tongue Pull Loop", {"pattern": r"tongue\s*pull\s*loop"}), ("Expensive", "expensive"), ("Cheap", "cheap"), ("Lightweight", "lightweight"), ("Heel Brake", {"pattern": r"heel\s*brake"}), ("Breathable", "breathable"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        "PROTECTION": {"name": "Protection", "units": None, "django_model": None, "parser": ("text",)},
+        "RANDING": {"name": "Randing", "units": None, "django_model": ("CharField", {"max_length": 10, "choices": (("full", "Full"), ("forefoot", "Forefoot"))}), "parser": ("choice", ("Full", "full"), ("Forefoot", "forefoot"))},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SENSITIVITY": {"name": "Sensitivity", "units": None, "django_model": None, "parser": ("text",)},
+        "SUPPORT": {"name": "Support", "units": None, "django_model": None, "parser": ("text",)},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "TOP": {"name": "Top", "units": None, "django_model": ("CharField", {"max_length": 4, "choices": (("low", "Low"), ("mid", "Mid"))}), "parser": ("choice", ("Low", "low"), ("Mid", "mid"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "WATERPROOFING": {"name": "Waterproofing", "units": None, "django_model": ("CharField", {"max_length": 32, "choices": (("waterproof", "Waterproof"), ("water resistant", "Water Resistant"))}), "parser": ("choice", ("Waterproof", "waterproof"), ("Water Resistant", {"pattern": r"water\s*resistant"}))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "BASKETBALL_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("expensive", "Expensive"), ("retro", "Retro"), ("ankle support", "Ankle Support"), ("outdoor", "Outdoor"), ("cheap", "Cheap"))})}), "parser": ("tag", ("Expensive", "expensive"), ("Retro", "retro"), ("Ankle Support", {"pattern": r"ankle\s*support"}), ("Outdoor", "outdoor"), ("Cheap", "cheap"))},
+        "LOCKDOWN": {"name": "Lockdown", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("fitadapt", "FitAdapt"), ("zipper", "Zipper"), ("laces", "Laces"), ("strap", "Strap"), ("slip-on", "Slip-On"))})}), "parser": ("tag", ("FitAdapt", "fitadapt"), ("Zipper", "zipper"), ("Laces", "lace-up"), ("Strap", "strap"), ("Slip-On", "slip-on"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SIGNATURE": {"name": "Signature", "units": None, "django_model": ("CharField", {"max_length": 128}), "parser": ("text",)},
+        "TOP": {"name": "Top", "units": None, "django_model": ("CharField", {"max_length": 5, "choices": (("low", "Low"), ("mid", "Mid"), ("high", "High"))}), "parser": ("choice", ("Low", "low"), ("Mid", "mid"), ("High", "high"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "CLIMBING_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("laces", "Laces"), ("velcro", "Velcro"), ("slip-on", "Slip-On"))})}), "parser": ("tag", ("Laces", "lace"), ("Velcro", "velcro"), ("Slip-On", "slip-on"))},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "CONSTRUCTION": {"name": "Construction", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("no-edge", "No-Edge"), ("board lasted", "Board Lasted"), ("slip lasted", "Slip Lasted"), ("vegan", "Vegan"))})}), "parser": ("tag", ("No-Edge", "no-edge"), ("Board Lasted", {"pattern": r"board\s*lasted"}), ("Slip Lasted", {"pattern": r"slip\s*lasted"}), ("Vegan", "vegan"))},
+        "DOWNTURN": {"name": "Downturn", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("neutral", "Neutral"), ("moderate", "Moderate"), ("aggressive", "Aggressive"))}), "parser": ("choice", ("Neutral", "neutral"), ("Moderate", "moderate"), ("Aggressive", "aggressive"))},
+        "ENVIRONMENT": {"name": "Environment", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("indoor", "Indoor"), ("outdoor", "Outdoor"))})}), "parser": ("tag", ("Indoor", "indoor"), ("Outdoor", "outdoor"))},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("expensive", "Expensive"), ("split tongue", "Split Tongue"), ("lightweight", "Lightweight"), ("cheap", "Cheap"))})}), "parser": ("tag", ("Expensive", "expensive"), ("Split Tongue", {"pattern": "split tongue"}), ("Lightweight", "lightweight"), ("Cheap", "cheap"))},
+        "FIT": {"name": "Fit", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("performance", "Performance"), ("comfort", "Comfort"))}), "parser": ("choice", ("Performance", "performance"), ("Comfort", "comfort"))},
+        "LAST_SHAPE": {"name": "Last Shape", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("asymmetric", "Asymmetric"), ("straight", "Straight"))}), "parser": ("choice", ("Asymmetric", "asymmetric"), ("Straight", "straight"))},
+        "LEVEL": {"name": "Level", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("beginner", "Beginner"), ("intermediate", "Intermediate"), ("advanced", "Advanced"))})}), "parser": ("tag", ("Beginner", "beginner"), ("Intermediate", "intermediate"), ("Advanced", "advanced"))},
+        "LINING": {"name": "Lined", "units": None, "django_model": ("BooleanField", {}), "parser": ("choice", (True, {"pattern": r"\blined\b"}), (False, {"pattern": r"\bunlined\b"}))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        "MIDSOLE": {"name": "Midsole", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("yes", "Yes"), ("full", "Full"), ("partial", "Partial"), ("no", "No"))}), "parser": ("choice", ("Yes", {"pattern": r"with\s*midsole"}), ("Full", "full"), ("Partial", "partial"), ("No", {"pattern": r"without\s*midsole"}))},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "STIFFNESS": {"name": "Stiffness", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("soft", "Soft"), ("medium", "Medium"), ("stiff", "Stiff"))}), "parser": ("choice", ("Soft", "soft"), ("Medium", "medium"), ("Stiff", "3/3"))},
+        "STRETCH": {"name": "Stretch", "units": None, "django_model": ("BooleanField", {}), "parser": ("choice", (True, {"pattern": r"size\s*stretch"}), (False, {"pattern": r"no\s*stretch"}))},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "THICKNESS": {"name": "Thickness", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        "TONGUE_PULL_LOOP": {"name": "Tongue Pull Loop", "units": None, "django_model": ("BooleanField", {}), "parser": ("choice", (True, "true"), (False, ("n/a", "false")))},
+        "TOP": {"name": "Top", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("low", "Low"), ("mid", "Mid"))}), "parser": ("choice", ("Low", "low"), ("Mid", "mid"))},
+        "USE": {"name": "Use", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("trad", "Trad"), ("face", "Face"), ("slab", "Slab"), ("overhang", "Overhang"), ("crack", "Crack"), ("sport", "Sport"), ("bouldering", "Bouldering"))})}), "parser": ("tag", ("Trad", ("trad", "all")), ("Face", ("face", "all")), ("Slab", ("slab", "all")), ("Overhang", ("overhang", "all")), ("Crack", ("crack", "all")), ("Sport", ("sport", "all")), ("Bouldering", ("bouldering", "all")))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WORN_BY": {"name": "Worn By", "units": None, "django_model": None, "parser": ("text",)}
+    },
+    "CROSSFIT_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "FOREFOOT_HEIGHT": {"name": "Forefoot Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_HEIGHT": {"name": "Heel Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_TOE_DROP": {"name": "Heel to Toe Drop", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "TOEBOX": {"name": "Toebox", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("medium", "Medium"), ("wide", "Wide"), ("extra wide", "Extra Wide"))}), "parser": ("choice", ("Narrow", "narrow"), ("Wide", {"unqualified": r"(extra\s*)?(wide)"}), ("Extra Wide", {"pattern": r"extra\s*wide"}), ("Medium", "medium"))},
+        "USE": {"name": "Use", "units": None, "django_model": None, "parser": ("text",)},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WIDTH": {"name": "Widths Available", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("standard", "Standard"), ("wide", "Wide"), ("extra wide", "Extra Wide"))})}), "parser": ("tag", ("Narrow", "narrow"), ("Standard", "normal"), ("Wide", {"pattern": r"(?<!\-)wide"}), ("Extra Wide", "x-wide"))}
+    },
+    "CYCLING_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLEAT_DESIGN": {"name": "Cleat Design", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 8, "choices": (("flat", "Flat"), ("2 holes", "2 Holes"), ("3 holes", "3 Holes"))})}), "parser": ("tag", ("Flat", "flat"), ("2 Holes", {"pattern": r"2\s*holes"}), ("3 Holes", {"pattern": r"3\s*holes"}))},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 8, "choices": (("velcro", "Velcro"), ("speed", "Speed"), ("ratchet", "Ratchet"), ("lace", "Lace"), ("BOA", "BOA"))})}), "parser": ("tag", ("Velcro", "velcro"), ("speed", "Speed"), ("Ratchet", "ratchet"), ("BOA", "boa"), ("Lace", "lace"))},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURE": {"name": "Feature", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "RIGIDITY": {"name": "Rigidity", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("rigid", "Rigid"), ("stiff", "Stiff"), ("moderate", "Moderate"), ("flexible", "Flexible"))}), "parser": ("choice", ("Rigid", "4/4"), ("Stiff", "3/4"), ("Moderate", "2/4"), ("Flexible", "1/4"))},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "USE": {"name": "Use", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("winter", "Winter"), ("indoor", "Indoor"), ("cyclocross", "Cyclocross"), ("casual", "Casual"), ("triathlon", "Triathlon"), ("gravel", "Gravel"), ("mountain", "Mountain"), ("road", "Road"))})}), "parser": ("tag", ("Winter", "winter"), ("Indoor", "indoor"), ("Cyclocross", "cyclocross"), ("Casual", "casual"), ("Triathlon", "triathlon"), ("Gravel", "gravel"), ("Mountain", "mountain"), ("Road", "road"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "FOOTBALL_CLEATS": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("strap", "Strap"), ("laces", "Laces"), ("ghost lacing", "Ghost Lacing"), ("slip-on", "Slip-On"))})}), "parser": ("tag", ("Strap", "strap"), ("Laces", "lace"), ("Ghost Lacing", {"pattern": r"ghost\s*lacing"}), ("Slip-On", "slip-on"))},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Price Tier", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("cheap", "Cheap"), ("expensive", "Expensive"))}), "parser": ("choice", ("Cheap", "cheap"), ("Expensive", "expensive"))},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "STUD_TYPE": {"name": "Molded Studs", "units": None, "django_model": ("BooleanField", {}), "parser": ("choice", (True, "molded"))},
+        "TOP": {"name": "Top", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("high", "High"), ("mid", "Mid"), ("low", "Low"))}), "parser": ("choice", ("High", "high"), ("Mid", "mid"), ("Low", "low"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WIDTH": {"name": "Width", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("narrow", "Narrow"), ("medium", "Medium"), ("wide", "Wide"))}), "parser": ("choice", ("Narrow", "narrow"), ("Medium", "medium"), ("Wide", "wide"))}
+    },
+    "GOLF_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("laces", "Laces"), ("slip-on", "Slip-On"), ("BOA", "BOA"))})}), "parser": ("tag", ("Laces", "laces"), ("Slip-On", "slip-on"), ("BOA", "boa"))},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("cheap", "Cheap"), ("breathable", "Breathable"), ("expensive", "Expensive"))})}), "parser": ("tag", ("Cheap", "cheap"), ("Breathable", "breathable"), ("Expensive", "expensive"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("leather", "Leather"), ("synthetic", "Synthetic"), ("knit", "Knit"), ("ortholite", "Ortholite"))})}), "parser": ("tag", ("Leather", "leather"), ("Synthetic", "synthetic"), ("Knit", "knit"), ("Ortholite", "ortholite"))},
+        "OUTSOLE": {"name": "Spiked", "units": None, "django_model": ("BooleanField", {}), "parser": ("choice", (True, "spiked"), (False, "spike-less"))},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "STYLE": {"name": "Style", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("athletic", "Athletic"), ("traditional", "Traditional"))}), "parser": ("choice", ("Athletic", "athletic"), ("Traditional", "traditional"))},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "WATERPROOFING": {"name": "Waterproofing", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("waterproof", "Waterproof"), ("water-resistant", "Water-Resistant"), ("water-repellant", "Water-Repellant"))}), "parser": ("choice", ("Waterproof", "waterproof"), ("Water-Resistant", "water-resistant"), ("Water-Repellant", "water-repellant"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "HIKING_BOOTS": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": None, "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "CONSTRUCTION": {"name": "Construction", "units": None, "django_model": None, "parser": ("text",)},
+        "CUT": {"name": "Cut", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("mid", "Mid"), ("high", "High"))}), "parser": ("choice", ("Mid", "mid"), ("High", "high"))},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        "FIT": {"name": "Fit", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("narrow heel", "Narrow Heel"), ("wide toebox", "Wide Toebox"))})}), "parser": ("tag", ("Narrow Heel", "narrow"), ("Wide Toebox", "wide"))},
+        "FOOT_CONDITION": {"name": "Foot Condition", "units": None, "django_model": None, "parser": ("text",)},
+        "GRAM_INSULATION": {"name": "Gram Insulation", "units": None, "django_model": None, "parser": ("text",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "ORIGIN": {"name": "Origin", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("USA", "USA"), ("European", "European"), ("Italian", "Italian"), ("German", "German"), ("Asian", "Asian"))}), "parser": ("choice", ("USA", "usa"), ("European", "european"), ("Italian", "italian"), ("German", "german"), ("Asian", "asian"))},
+        "ORTHOTIC_FRIENDLY": {"name": "Orthotic Friendly", "units": None, "django_model": ("BooleanField", {}), "parser": ("choice", (True, "true"), (False, ("n/a", "false")))},
+        "PRONATION": {"name": "Pronation", "units": None, "django_model": None, "parser": ("text",)},
+        "PROTECTION": {"name": "Protection", "units": None, "django_model": None, "parser": ("text",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SEASON": {"name": "Season", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 8, "choices": (("winter", "Winter"), ("summer", "Summer"))})}), "parser": ("tag", ("Winter", "winter"), ("Summer", "summer"))},
+        "SUPPORT": {"name": "Support", "units": None, "django_model": None, "parser": ("text",)},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "USE": {"name": "Use", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("day", "Day"), ("backpacking", "Backpacking"), ("urban", "Urban"), ("light", "Light"), ("alpine", "Alpine"), ("snow", "Snow"), ("water", "Water"), ("speed", "Speed"), ("desert", "Desert"))})}), "parser": ("tag", ("Day", "day"), ("Backpacking", "backpacking"), ("Urban", "urban"), ("Light", "light"), ("Alpine", "alpine"), ("Snow", "snow"), ("Water", "water"), ("Speed", "speed"), ("Desert", "desert"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WATERPROOFING": {"name": "Waterproofing", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("waterproof", "Waterproof"), ("water repellent", "Water Repellent"))}), "parser": ("choice", ("Water Repellent", "repellent"), ("Waterproof", "waterproof"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WIDTH": {"name": "Widths Available", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("standard", "Standard"), ("wide", "Wide"), ("extra wide", "Extra Wide"))})}), "parser": ("tag", ("Narrow", "narrow"), ("Standard", "normal"), ("Wide", {"pattern": r"(?<!\-)wide"}), ("Extra Wide", "x-wide"))},
+        "ZERO_DROP": {"name": "Zero Drop", "units": None, "django_model": ("BooleanField", {}), "parser": ("choice", (True, "true"), (False, ("false", "n/a")))}
+    },
+    "HIKING_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("laces", "Laces"), ("slip on", "Slip On"))}), "parser": ("choice", ("Laces", "lace up"), ("Slip On", "slip on"))},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "CONSTRUCTION": {"name": "Construction", "units": None, "django_model": None, "parser": ("text",)},
+        "CUT": {"name": "Cut", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("low", "Low"), ("mid", "Mid"))}), "parser": ("choice", ("Low", "low"), ("Mid", "mid"))},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        "FIT": {"name": "Fit", "units": None, "django_model": None, "parser": ("text",)},
+        "FOOT_CONDITION": {"name": "Foot Condition", "units": None, "django_model": None, "parser": ("text",)},
+        "GRAM_INSULATION": {"name": "Gram Insulation", "units": None, "django_model": None, "parser": ("text",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "ORIGIN": {"name": "Origin", "units": None, "django_model": None, "parser": ("text",)},
+        "PRONATION": {"name": "Pronation", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 32, "choices": (("supination", "Supination"), ("underpronation", "Underpronation"), ("neutral", "Neutral"), ("overpronation", "Overpronation"), ("severe overpronation", "Severe Overpronation"))})}), "parser": ("tag", ("Supination", "supination"), ("Underpronation", "underpronation"), ("Neutral", "neutral"), ("Overpronation", {"unqualified": r"(severe\s*)?(overpronation)"}), ("Severe Overpronation", {"pattern": r"severe\s*overpronation"}))},
+        "PROTECTION": {"name": "Protection", "units": None, "django_model": None, "parser": ("text",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SEASON": {"name": "Season", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 10, "choices": (("summer", "Summer"), ("winter", "Winter"))})}), "parser": ("tag", ("Summer", "summer"), ("Winter", "winter"))},
+        "SUPPORT": {"name": "Support", "units": None, "django_model": None, "parser": ("text",)},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "USE": {"name": "Use", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("snow", "Snow"), ("desert", "Desert"), ("water", "Water"), ("backpacking", "Backpacking"), ("light", "Light"), ("speed", "Speed"), ("urban", "Urban"), ("day", "Day"))})}), "parser": ("tag", ("Snow", "snow"), ("Desert", "desert"), ("Water", "water"), ("Backpacking", "backpacking"), ("Light", "light"), ("Speed", "speed"), ("Urban", "urban"), ("Day", "day"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "WATERPROOFING": {"name": "Waterproofing", "units": None, "django_model": ("CharField", {"max_length": 32, "choices": (("waterproof", "Waterproof"), ("water repellant", "Water Repellant"))}), "parser": ("choice", ("Waterproof", "waterproof"), ("Water Repellant", {"pattern": r"water\s*repellant"}))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WIDTH": {"name": "Widths Available", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("standard", "Standard"), ("wide", "Wide"), ("extra wide", "Extra Wide"))})}), "parser": ("tag", ("Narrow", "narrow"), ("Standard", "normal"), ("Wide", {"pattern": r"(?<!\-)wide"}), ("Extra Wide", "x-wide"))}
+    },
+    "RUNNING_SHOES": {
+        "ARCH_SUPPORT": {"name": "Arch Support", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("stability", "Stability"), ("neutral", "Neutral"), ("motion control", "Motion control"))}), "parser": ("choice", ("Stability", "stability"), ("Neutral", "neutral"), ("Motion control", {"pattern": r"motion\s*control"}))},
+        "ARCH_TYPE": {"name": "Arch Type", "units": None, "django_model": ("CharField", {"max_length": 5, "choices": (("low", "Low"), ("high", "High"))}), "parser": ("exact", {"High arch": "High", "Low arch": "Low"})},
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "CUSHIONING": {"name": "Cushioning", "units": None, "django_model": ("CharField", {"max_length": 10, "choices": (("firm", "Firm"), ("balanced", "Balanced"), ("plush", "Plush"))}), "parser": ("choice", ("Firm", "firm"), ("Balanced", "balanced"), ("Plush", "plush"))},
+        "DISTANCE": {"name": "Distance", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        "FLEXIBILITY": {"name": "Flexibility", "units": None, "django_model": ("CharField", {"max_length": 24, "choices": (("rigid", "Rigid"), ("semi-rigid", "Semi-Rigid"), ("balanced", "Balanced"), ("semi-flexible", "Semi-Flexible"), ("flexible", "Flexible"))}), "parser": ("choice", ("Rigid", "very stiff"), ("Semi-Rigid", "stiff"), ("Balanced", "moderate"), ("Semi-Flexible", {"unqualified": r"(very\s*)?(flexible)"}), ("Flexible", {"pattern": r"very\s*flexible"}))},
+        "FOOT_CONDITION": {"name": "Foot Condition", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "FOREFOOT_HEIGHT": {"name": "Forefoot Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_HEIGHT": {"name": "Heel Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_TOE_DROP": {"name": "Heel to Toe Drop", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "PACE": {"name": "Pace", "units": None, "django_model": None, "parser": ("text",)},
+        "PRONATION": {"name": "Pronation", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 32, "choices": (("supination", "Supination"), ("underpronation", "Underpronation"), ("neutral", "Neutral"), ("overpronation", "Overpronation"), ("severe overpronation", "Severe Overpronation"))})}), "parser": ("tag", ("Supination", "supination"), ("Underpronation", "underpronation"), ("Neutral", "neutral"), ("Overpronation", {"unqualified": r"(severe\s*)?(overpronation)"}), ("Severe Overpronation", {"pattern": r"severe\s*overpronation"}))},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SEASON": {"name": "Season", "units": None, "django_model": None, "parser": ("text",)},
+        "STRIKE_PATTERN": {"name": "Strike Pattern", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 10, "choices": (("forefoot", "Forefoot"), ("midfoot", "Midfoot"), ("heel", "Heel"))})}), "parser": ("tag", ("Forefoot", "forefoot"), ("Midfoot", "midfoot"), ("Heel", "heel"))},
+        "SUMMER": {"name": "Summer", "units": None, "django_model": None, "parser": ("text",)},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "TERRAIN": {"name": "Terrain", "units": None, "django_model": ("CharField", {"max_length": 5, "choices": (("road", "Road"), ("trail", "Trail"))}), "parser": ("choice", ("Road", "road"), ("Trail", "trail"))},
+        "TOEBOX": {"name": "Toebox", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("medium", "Medium"), ("wide", "Wide"), ("extra wide", "Extra Wide"))}), "parser": ("choice", ("Narrow", "narrow"), ("Wide", {"unqualified": r"(extra\s*)?(wide)"}), ("Extra Wide", {"pattern": r"extra\s*wide"}), ("Medium", "medium"))},
+        "TYPE": {"name": "Type", "units": None, "django_model": None, "parser": ("text",)},
+        "ULTRA_RUNNING": {"name": "Ultra Running", "units": None, "django_model": None, "parser": ("text",)},
+        "USE": {"name": "Use", "units": None, "django_model": None, "parser": ("text",)},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WATERPROOFING": {"name": "Waterproofing", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("waterproof", "Waterproof"), ("water repellent", "Water Repellent"))}), "parser": ("choice", ("Water Repellent", "repellent"), ("Waterproof", "waterproof"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WIDTH": {"name": "Widths Available", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("standard", "Standard"), ("wide", "Wide"), ("extra wide", "Extra Wide"))})}), "parser": ("tag", ("Narrow", "narrow"), ("Standard", "normal"), ("Wide", {"pattern": r"(?<!\-)wide"}), ("Extra Wide", "x-wide"))}
+    },
+    "SNEAKERS": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("pull toggle", "Pull Toggle"), ("buckle", "Buckle"), ("zipper", "Zipper"), ("velcro", "Velcro"), ("laces", "Laces"), ("slip-on", "Slip-On"))})}), "parser": ("tag", ("Pull Toggle", {"pattern": r"pull\s*toggle"}), ("Buckle", "buckle"), ("Zipper", "zipper"), ("Velcro", "velcro"), ("Laces", "laces"), ("Slip-On", "slip-on"))},
+        "COLLABORATION": {"name": "Collaboration", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "DESIGNED_BY": {"name": "Designed By", "units": None, "django_model": ("CharField", {"max_length": 128}), "parser": ("text",)},
+        "EMBELLISHMENT": {"name": "Embellishment", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("rhinestone", "Rhinestone"), ("sequin", "Sequin"), ("spikes", "Spikes"), ("embroidered", "Embroidered"), ("crystal", "Crystal"), ("glitter", "Glitter"))}), "parser": ("choice", ("Rhinestone", "rhinestone"), ("Sequin", "sequin"), ("Spikes", "spikes"), ("Embroidered", "embroidered"), ("Crystal", "crystal"), ("Glitter", "glitter"))},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        "INSPIRED_FROM": {"name": "Inspired From", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("running", "Running"), ("casual", "Casual"), ("skate", "Skate"), ("basketball", "Basketball"), ("hiking", "Hiking"), ("tennis", "Tennis"), ("training", "Training"), ("football", "Football"), ("soccer", "Soccer"), ("boat", "Boat"))}), "parser": ("choice", ("Running", "running"), ("Casual", "casual"), ("Skate", "skate"), ("Basketball", "basketball"), ("Hiking", "hiking"), ("Tennis", "tennis"), ("Training", "training"), ("Football", "football"), ("Soccer", "soccer"), ("Boat", "boat"))},
+        "LACE_TYPE": {"name": "Lace Type", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 32, "choices": (("self-lacing", "Self-Lacing"), ("cotton lace", "Cotton Lace"), ("round lace", "Round Lace"), ("synthetic lace", "Synthetic Lace"), ("no lace", "No Lace"), ("leather lace", "Leather Lace"), ("elastic lace", "Elastic Lace"), ("flat lace", "Flat Lace"), ("toggle lace", "Toggle Lace"))})}), "parser": ("tag", ("Self-Lacing", "self-lacing"), ("Cotton Lace", {"pattern": r"cotton\s*lace"}), ("Round Lace", {"pattern": r"round\s*lace"}), ("Synthetic Lace", {"pattern": r"synthetic\s*lace"}), ("No Lace", {"pattern": r"no\s*lace"}), ("Leather Lace", {"pattern": r"leather\s*lace"}), ("Elastic Lace", {"pattern": r"elastic\s*lace"}), ("Flat Lace", {"pattern": r"flat\s*lace"}), ("Toggle Lace", {"pattern": r"toggle\s*lace"}))},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "ORIGIN": {"name": "Origin", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("USA", "USA"), ("European", "European"), ("Italian", "Italian"), ("German", "German"), ("Asian", "Asian"))}), "parser": ("choice", ("USA", "usa"), ("European", "european"), ("Italian", "italian"), ("German", "german"), ("Asian", "asian"))},
+        "PRINT": {"name": "Print", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 32, "choices": (("snakeskin", "Snakeskin"), ("leopard", "Leopard"), ("camouflage", "Camouflage"), ("floral", "Floral"), ("tiger", "Tiger"), ("striped", "Striped"), ("rainbow", "Rainbow"), ("tie dye", "Tie Dye"), ("cheetah", "Cheetah"), ("zebra", "Zebra"), ("flame", "Flame"), ("checkered", "Checkered"), ("animal", "Animal"), ("graphic", "Graphic"))})}), "parser": ("tag", ("Snakeskin", "snakeskin"), ("Leopard", "leopard"), ("Camouflage", "camouflage"), ("Floral", "floral"), ("Tiger", "tiger"), ("Striped", "striped"), ("Rainbow", "rainbow"), ("Tie Dye", {"pattern": r"tie\s*dye"}), ("Cheetah", "cheetah"), ("Zebra", "zebra"), ("Flame", "flame"), ("Checkered", "checkered"), ("Animal", "animal"), ("Graphic", "graphic"))},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SEASON": {"name": "Season", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 8, "choices": (("spring", "Spring"), ("summer", "Summer"), ("fall", "Fall"), ("winter", "Winter"))})}), "parser": ("tag", ("Spring", "spring"), ("Summer", "summer"), ("Fall", "fall"), ("Winter", "winter"))},
+        "STYLE": {"name": "Style", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("retro", "Retro"), ("classic", "Classic"), ("Dad", "Dad"), ("sporty", "Sporty"), ("minimalist", "Minimalist"), ("platform", "Platform"), ("sock", "Sock"), ("futuristic", "Futuristic"), ("dressy", "Dressy"), ("chunky", "Chunky"), ("sneakerboots", "Sneakerboots"), ("mule", "Mule"), ("wedge", "Wedge"), ("deconstructed", "Deconstructed"), ("clogs", "Clogs"))})}), "parser": ("tag", ("Retro", "retro"), ("Classic", "classic"), ("Dad", "dad"), ("Sporty", "sporty"), ("Minimalist", "minimalist"), ("Platform", "platform"), ("Sock", "sock"), ("Futuristic", "futuristic"), ("Dressy", "dressy"), ("Chunky", "chunky"), ("Sneakerboots", "sneakerboots"), ("Mule", "mule"), ("Wedge", "wedge"), ("Deconstructed", "deconstructed"), ("Clogs", "clogs"))},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "TOP": {"name": "Top", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("low", "Low"), ("mid", "Mid"), ("high", "High"))}), "parser": ("choice", ("Low", "low"), ("Mid", "mid"), ("High", "high"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "SOCCER_CLEATS": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "LACING_SYSTEM": {"name": "Lacing System", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("ghost lacing", "Ghost Lacing"), ("laced", "Laced"), ("laceless", "Laceless"))}), "parser": ("choice", ("Ghost Lacing", {"pattern": r"ghost\s*lacing"}), ("Laced", "laced"), ("Laceless", "laceless"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Price Tier", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("cheap", "Cheap"), ("expensive", "Expensive"))}), "parser": ("choice", ("Cheap", "cheap"), ("Expensive", "expensive"))},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SIGNATURE": {"name": "Signature", "units": None, "django_model": None, "parser": ("text",)},
+        "SURFACE": {"name": "Surface", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("flexible ground", "Flexible Ground"), ("soft ground", "Soft Ground"), ("indoor", "Indoor"), ("turf", "Turf"), ("firm ground", "Firm Ground"), ("street", "Street"))}), "parser": ("choice", ("Flexible Ground", {"pattern": r"flexible\s*ground"}), ("Soft Ground", {"pattern": r"soft\s*ground"}), ("Indoor", "indoor"), ("Turf", "turf"), ("Firm Ground", {"pattern": r"firm\s*ground"}), ("Street", "street"))},
+        "TOP": {"name": "Top", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("low", "Low"), ("mid", "Mid"), ("high", "High"))}), "parser": ("choice", ("Low", "low"), ("Mid", "mid"), ("High", "high"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "TENNIS_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLABORATION": {"name": "Collaboration", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "CONSTRUCTION": {"name": "Construction", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("speed", "Speed"), ("stability", "Stability"), ("cushioned", "Cushioned"))}), "parser": ("choice", ("Speed", "speed"), ("Stability", "stability"), ("Cushioned", "cushioned"))},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURE": {"name": "Feature", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SHOE_TYPE": {"name": "Surface", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 8, "choices": (("clay", "Clay"), ("hard", "Hard"))})}), "parser": ("tag", ("Clay", ("clay", "all")), ("Hard", ("hard", "all")))},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "TRACK_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("slip-on", "Slip-On"), ("hook & loop", "Hook & Loop"), ("lace-up", "Lace-Up"))})}), "parser": ("tag", ("Slip-On", "slip-on"), ("Hook & Loop", {"pattern": r"hook\s*and\s*loop"}), ("Lace-Up", "lace-up"))},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EVENT": {"name": "Event", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("running", "Running"), ("throwing", "Throwing"), ("jumping", "Jumping"))}), "parser": ("choice", ("Running", "running"), ("Throwing", "throwing"), ("Jumping", "jumping"))},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURE": {"name": "Feature", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "SPIKE_SIZE": {"name": "Spike Size", "units": "inch", "django_model": ("CharField", {"max_length": 8, "choices": (("3/8", "3/8"), ("5/16", "5/16"), ("1/4", "1/4"), ("3/16", "3/16"), ("1/8", "1/8"))}), "parser": ("choice", ("3/8", "3/8"), ("5/16", "5/16"), ("1/4", "1/4"), ("3/16", "3/16"), ("1/8", "1/8"))},
+        "SPIKE_TYPE": {"name": "Spike Type", "units": None, "django_model": ("CharField", {"max_length": 8, "choices": (("pyramid", "Pyrimad"), ("blank", "Blank"), ("tree", "Tree"))}), "parser": ("choice", ("Pyramid", "pyramid"), ("Blank", "blank"), ("Tree", "tree"))},
+        "SURFACE": {"name": "Surface", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("indoor", "Indoor"), ("asphalt", "Asphalt"), ("grass", "Grass"), ("dirt", "Dirt"), ("wood", "Wood"), ("rubber", "Rubber"), ("all-weather", "All-Weather"))})}), "parser": ("tag", ("Indoor", "indoor"), ("Asphalt", "asphalt"), ("Grass", "grass"), ("Dirt", "dirt"), ("Wood", "wood"), ("Rubber", "rubber"), ("All-Weather", "all-weather"))},
+        "USE": {"name": "Use", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 32, "choices": (("shot put", "Shot Put"), ("mid distance", "Mid Distance"), ("sprints", "Sprints"), ("long distance", "Long Distance"), ("high jump", "High Jump"), ("pole vault", "Pole Vault"), ("long jump", "Long Jump"), ("cross country", "Cross Country"), ("triple jump", "Triple Jump"), ("discus", "Discus"), ("hurdles", "Hurdles"), ("hammer throw", "Hammer Throw"), ("javelin", "Javelin"), ("relays", "Relays"), ("steeplechase", "Steeplechase"))})}), "parser": ("tag", ("Shot Put", {"pattern": r"shot\s*put"}), ("Mid Distance", {"pattern": r"mid\s*distance"}), ("Sprints", "sprints"), ("Long Distance", {"pattern": r"long\s*distance"}), ("High Jump", {"pattern": r"high\s*jump"}), ("Pole Vault", {"pattern": r"pole\s*vault"}), ("Long Jump", {"pattern": r"long\s*jump"}), ("Cross Country", {"pattern": r"cross\s*country"}), ("Triple Jump", {"pattern": r"triple\s*jump"}), ("Discus", "discus"), ("Hurdles", "hurdles"), ("Hammer Throw", {"pattern": r"hammer\s*throw"}), ("Javelin", "javelin"), ("Relays", "relays"), ("Steeplechase", "steeplechase"))},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    },
+    "TRAIL_SHOES": {
+        "ARCH_SUPPORT": {"name": "Arch Support", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("stability", "Stability"), ("neutral", "Neutral"), ("motion control", "Motion control"))}), "parser": ("choice", ("Stability", "stability"), ("Neutral", "neutral"), ("Motion control", {"pattern": r"motion\s*control"}))},
+        "ARCH_TYPE": {"name": "Arch Type", "units": None, "django_model": ("CharField", {"max_length": 5, "choices": (("low", "Low"), ("high", "High"))}), "parser": ("exact", {"High arch": "High", "Low arch": "Low"})},
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "CUSHIONING": {"name": "Cushioning", "units": None, "django_model": ("CharField", {"max_length": 10, "choices": (("firm", "Firm"), ("balanced", "Balanced"), ("plush", "Plush"))}), "parser": ("choice", ("Firm", "firm"), ("Balanced", "balanced"), ("Plush", "plush"))},
+        "DISTANCE": {"name": "Distance", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        "FLEXIBILITY": {"name": "Flexibility", "units": None, "django_model": ("CharField", {"max_length": 24, "choices": (("rigid", "Rigid"), ("semi-rigid", "Semi-Rigid"), ("balanced", "Balanced"), ("semi-flexible", "Semi-Flexible"), ("flexible", "Flexible"))}), "parser": ("choice", ("Rigid", "very stiff"), ("Semi-Rigid", "stiff"), ("Balanced", "moderate"), ("Semi-Flexible", {"unqualified": r"(very\s*)?(flexible)"}), ("Flexible", {"pattern": r"very\s*flexible"}))},
+        "FOOT_CONDITION": {"name": "Foot Condition", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "FOREFOOT_HEIGHT": {"name": "Forefoot Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_HEIGHT": {"name": "Heel Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_TOE_DROP": {"name": "Heel to Toe Drop", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "PACE": {"name": "Pace", "units": None, "django_model": None, "parser": ("text",)},
+        "PRONATION": {"name": "Pronation", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 32, "choices": (("supination", "Supination"), ("underpronation", "Underpronation"), ("neutral", "Neutral"), ("overpronation", "Overpronation"), ("severe overpronation", "Severe Overpronation"))})}), "parser": ("tag", ("Supination", "supination"), ("Underpronation", "underpronation"), ("Neutral", "neutral"), ("Overpronation", {"unqualified": r"(severe\s*)?(overpronation)"}), ("Severe Overpronation", {"pattern": r"severe\s*overpronation"}))},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SEASON": {"name": "Season", "units": None, "django_model": None, "parser": ("text",)},
+        "STRIKE_PATTERN": {"name": "Strike Pattern", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 10, "choices": (("forefoot", "Forefoot"), ("midfoot", "Midfoot"), ("heel", "Heel"))})}), "parser": ("tag", ("Forefoot", "forefoot"), ("Midfoot", "midfoot"), ("Heel", "heel"))},
+        "SUMMER": {"name": "Summer", "units": None, "django_model": None, "parser": ("text",)},
+        "TECHNOLOGY": {"name": "Technology", "units": None, "django_model": None, "parser": ("text",)},
+        "TERRAIN": {"name": "Terrain", "units": None, "django_model": None, "parser": ("text",)},
+        "TOEBOX": {"name": "Toebox", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("medium", "Medium"), ("wide", "Wide"), ("extra wide", "Extra Wide"))}), "parser": ("choice", ("Narrow", "narrow"), ("Wide", {"unqualified": r"(extra\s*)?(wide)"}), ("Extra Wide", {"pattern": r"extra\s*wide"}), ("Medium", "medium"))},
+        "TYPE": {"name": "Type", "units": None, "django_model": None, "parser": ("text",)},
+        "ULTRA_RUNNING": {"name": "Ultra Running", "units": None, "django_model": None, "parser": ("text",)},
+        "USE": {"name": "Use", "units": None, "django_model": None, "parser": ("text",)},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WATERPROOFING": {"name": "Waterproofing", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("waterproof", "Waterproof"), ("water repellent", "Water Repellent"))}), "parser": ("choice", ("Water Repellent", "repellent"), ("Waterproof", "waterproof"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WIDTH": {"name": "Widths Available", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("standard", "Standard"), ("wide", "Wide"), ("extra wide", "Extra Wide"))})}), "parser": ("tag", ("Narrow", "narrow"), ("Standard", "normal"), ("Wide", {"pattern": r"(?<!\-)wide"}), ("Extra Wide", "x-wide"))}
+    },
+    "TRAINING_SHOES": {
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("expensive", "Expensive"), ("high drop", "High Drop"), ("slip-on", "Slip-On"), ("minimalist", "Minimalist"), ("cheap", "Cheap"), ("low drop", "Low Drop"), ("lightweight", "Lightweight"))})}), "parser": ("tag", ("Expensive", "expensive"), ("High Drop", {"pattern": r"high\s*drop"}), ("Slip-On", "slip-on"), ("Minimalist", "minimalist"), ("Cheap", "cheap"), ("Low Drop", {"pattern": r"low\s*drop"}), ("Lightweight", "lightweight"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "FOREFOOT_HEIGHT": {"name": "Forefoot Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_HEIGHT": {"name": "Heel Height", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "HEEL_TOE_DROP": {"name": "Heel to Toe Drop", "units": "mm", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("range", "mm")},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "NUMBER_OF_REVIEWS": {"name": "Number of Reviews", "units": None, "django_model": None, "parser": ("text",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "TOEBOX": {"name": "Toebox", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("medium", "Medium"), ("wide", "Wide"), ("extra wide", "Extra Wide"))}), "parser": ("choice", ("Narrow", "narrow"), ("Wide", {"unqualified": r"(extra\s*)?(wide)"}), ("Extra Wide", {"pattern": r"extra\s*wide"}), ("Medium", "medium"))},
+        "USE": {"name": "Use", "units": None, "django_model": None, "parser": ("text",)},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")},
+        "WIDTH": {"name": "Widths Available", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("standard", "Standard"), ("wide", "Wide"), ("extra wide", "Extra Wide"))})}), "parser": ("tag", ("Narrow", "narrow"), ("Standard", "normal"), ("Wide", {"pattern": r"(?<!\-)wide"}), ("Extra Wide", "x-wide"))}
+    },
+    "WALKING_SHOES": {
+        "ARCH_SUPPORT": {"name": "Arch Support", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("stability", "Stability"), ("neutral", "Neutral"), ("motion control", "Motion control"))}), "parser": ("choice", ("Stability", "stability"), ("Neutral", "neutral"), ("Motion control", {"pattern": r"motion\s*control"}))},
+        "BRAND": {"name": "Brand", "units": None, "django_model": ("CharField", {"max_length": 32}), "parser": ("text",)},
+        "CLOSURE": {"name": "Closure", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 8, "choices": (("bungee", "Bungee"), ("velcro", "Velcro"), ("lace-up", "Lace-Up"), ("slip-on", "Slip-On"))})}), "parser": ("tag", ("Bungee", "bungee"), ("Velcro", "velcro"), ("Lace-Up", "lace-up"), ("Slip-On", "slip-on"))},
+        "COLLECTION": {"name": "Collection", "units": None, "django_model": None, "parser": ("text",)},
+        "CONDITION": {"name": "Condition", "units": None, "django_model": None, "parser": ("text",)},
+        "EXPERT_RATING": {"name": "Expert Rating", "units": None, "django_model": None, "parser": ("text",)},
+        "FEATURES": {"name": "Features", "units": None, "django_model": None, "parser": ("text",)},
+        "MATERIAL": {"name": "Material", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("wool", "Wool"), ("suede", "Suede"), ("mesh", "Mesh"), ("knit", "Knit"), ("synthetic", "Synthetic"), ("canvas", "Canvas"), ("leather", "Leather"))}), "parser": ("choice", ("Wool", "wool"), ("Suede", "suede"), ("Mesh", "mesh"), ("Knit", "knit"), ("Synthetic", "synthetic"), ("Canvas", "canvas"), ("Leather", "leather"))},
+        # BUG FOUND DUE TO UNIT TESTING
+        "MSRP": {"name": "MSRP", "units": "USD", "django_model": ("DecimalField", {"max_digits": 7, "decimal_places": 2, "min": 0}), "parser": ("price",)},
+        "RELEASE_DATE": {"name": "Release Date", "units": None, "django_model": ("PositiveIntegerField", {"min": 1970, "max_years_ahead": 1}), "parser": ("year",)},
+        "REVIEW_TYPE": {"name": "Review Type", "units": None, "django_model": None, "parser": ("text",)},
+        "SALES_PRICE": {"name": "Sales Price", "units": "USD", "django_model": None, "parser": ("text",)},
+        "SCORE": {"name": "Score", "units": None, "django_model": None, "parser": ("text",)},
+        "SURFACE": {"name": "Surface", "units": None, "django_model": ("ArrayField", {"base_field": ("CharField", {"max_length": 16, "choices": (("cobblestone", "Cobblestone"), ("trail", "Trail"), ("concrete", "Concrete"))})}), "parser": ("tag", ("Cobblestone", "cobblestone"), ("Trail", "trail"), ("Concrete", "concrete"))},
+        "TOEBOX": {"name": "Toebox", "units": None, "django_model": ("CharField", {"max_length": 16, "choices": (("narrow", "Narrow"), ("medium", "Medium"), ("wide", "Wide"), ("extra wide", "Extra Wide"))}), "parser": ("choice", ("Narrow", "narrow"), ("Wide", {"unqualified": r"(extra\s*)?(wide)"}), ("Extra Wide", {"pattern": r"extra\s*wide"}), ("Medium", "medium"))},
+        "USE": {"name": "Use", "units": None, "django_model": None, "parser": ("text",)},
+        "USER_RATING": {"name": "User Rating", "units": None, "django_model": None, "parser": ("text",)},
+        # BUG FOUND DUE TO UNIT TESTING
+        "WEIGHT": {"name": "Weight", "units": "oz", "django_model": ("DecimalField", {"max_digits": 3, "decimal_places": 1, "min": 0}), "parser": ("decimal", "oz")}
+    }
+}
@@ -0,0 +1,2180 @@
+from aggregate import ColumnSelector, Gender, Url_Paths
+import atexit
+import base64
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+import csv
+from django.apps import apps
+from django.db import connection, connections, transaction
+from enum import Enum, auto
+import functools
+import hashlib
+from html.parser import HTMLParser
+import itertools
+import json
+import multiprocessing
+from multiprocessing.util import Finalize
+import os
+import platform
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+class Backend(Enum):
+    HTTP = auto()
+    SELENIUM = auto()
+    XHR = auto()        # Experimental: the mapping of the catalog data response is only tested against a hand-written fixture
+
+# URL patterns (Network.setBlockedURLs syntax) of resources the scraper never reads
+class BlockedResource(Enum):
+    IMAGES = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico")
+    FONTS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*")
+    MEDIA = ("*.mp4", "*.webm", "*.ogg", "*.mp3", "*youtube.com/embed*", "*player.vimeo.com*")
+    ADS = ("*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*", "*amazon-adsystem.com*", "*adnxs.com*", "*criteo.com*", "*taboola.com*", "*outbrain.com*")
+    TRACKERS = ("*google-analytics.com*", "*googletagmanager.com*", "*connect.facebook.net*", "*hotjar.com*", "*clarity.ms*", "*segment.com*", "*scorecardresearch.com*", "*quantserve.com*")
+
+    def get_url_patterns(self):
+        return list(self.value)
+
+class SnapshotMode(Enum):
+    RECORD = auto()     # Scrape the live site and store everything that is read
+    REPLAY = auto()     # Serve everything from the snapshot, without a browser or network access
+
+# Reads the server-rendered slim list: shoe names, column checkbox states (in menu order)
+# and the text of every facts column, mirroring the selectors used through Selenium
+class _CatalogPageParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.names = []
+        self.states = []
+        self.facts = []
+        self._div_depth = 0
+        self._column_depth = None
+        self._values_depth = None
+        self._score_depth = None
+        self._name = None
+        self._score = None
+        self._spans = []
+
+    @staticmethod
+    def _normalize(text):
+        return ' '.join(text.split())
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+        if tag == 'div':
+            self._div_depth += 1
+            if 'catalog-list-slim__facts__column' in classes and self._column_depth is None:
+                self._column_depth = self._div_depth
+                self.facts.append({'span': [], 'score': []})
+            elif self._column_depth is not None and 'catalog-list-slim__shoes-fact__values' in classes and self._values_depth is None:
+                self._values_depth = self._div_depth
+            elif self._values_depth is not None and 'corescore__score' in classes and 'score_green' in classes and self._score_depth is None:
+                self._score_depth = self._div_depth
+                self._score = []
+        elif tag == 'span' and self._values_depth is not None:
+            self._spans.append([])
+        elif tag == 'a' and 'catalog-list-slim__names' in classes:
+            self._name = []
+        elif tag == 'input' and attrs.get('type') == 'checkbox' and (attrs.get('id') or '').startswith('fact-'):
+            self.states.append([attrs['id'], 'checked' in attrs])
+
+    def handle_endtag(self, tag):
+        if tag == 'div':
+            if self._score_depth == self._div_depth:
+                self.facts[-1]['score'].append(self._normalize(''.join(self._score)))
+                self._score_depth = None
+                self._score = None
+            if self._values_depth == self._div_depth:
+                self._values_depth = None
+                self._spans = []
+            if self._column_depth == self._div_depth:
+                self._column_depth = None
+            self._div_depth -= 1
+        elif tag == 'span' and len(self._spans) > 0:
+            self.facts[-1]['span'].append(self._normalize(''.join(self._spans.pop())))
+        elif tag == 'a' and self._name is not None:
+            self.names.append(self._normalize(''.join(self._name)))
+            self._name = None
+
+    def handle_data(self, data):
+        if self._name is not None:
+            self._name.append(data)
+        if self._score is not None:
+            self._score.append(data)
+        for span in self._spans:
+            span.append(data)
+
+# Wall-clock time per phase (overall, per page and per column) and event counters of a single scrape,
+# phases never nest so their times add up to the time spent inside the scraper (and the serializer threads
+# of a pipelined scrape, whose phases count towards the page the browser is on)
+class _ScrapeMetrics:
+    def __init__(self, url_path=None, gender=None, pages=None):
+        self.url_path = url_path
+        self.gender = gender
+        self.total_pages = len(pages) if pages is not None and len(pages) > 0 else None
+        self.start = time.perf_counter()
+        self.phases = {}
+        self.columns = {}
+        self.counters = {}
+        self.pages = []
+        self._open_pages = {}
+        self._page = None
+        self._column = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _add(phases, name, elapsed):
+        entry = phases.setdefault(name, {"seconds": 0.0, "count": 0})
+        entry["seconds"] += elapsed
+        entry["count"] += 1
+
+    @contextmanager
+    def phase(self, name, column=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._add(self.phases, name, elapsed)
+                if column is None:
+                    column = self._column
+                if column is not None:
+                    self._add(self.columns.setdefault(column.name, {}), name, elapsed)
+                if self._page is not None:
+                    self._add(self._page["phases"], name, elapsed)
+
+    # Attributes every phase inside the block to column
+    @contextmanager
+    def column(self, column):
+        self._column = column
+        try:
+            yield
+        finally:
+            self._column = None
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def startPage(self, page):
+        self._page = {"page": page, "start": time.perf_counter(), "phases": {}}
+        self._open_pages[page] = self._page
+
+    # Pages end in the order they are written, which may be after later pages have started
+    def endPage(self, page, rows=0):
+        page = self._open_pages.pop(page)
+        if page is self._page:
+            self._page = None
+        page["seconds"] = time.perf_counter() - page.pop("start")
+        page["rows"] = rows
+        self.pages.append(page)
+        if rows == 0:
+            return
+        finished = [record for record in self.pages if record["rows"] > 0]
+        done = len(finished)
+        mean = sum(record["seconds"] for record in finished) / done
+        category = self.url_path.name if self.url_path is not None else ""
+        if self.total_pages is None:
+            print(f"{category} page {page['page']}: {page['seconds']:.2f}s ({mean:.2f}s per page)", file=sys.stderr)
+        else:
+            print(f"{category} page {page['page']} ({done}/{self.total_pages}): {page['seconds']:.2f}s, ETA {mean * max(self.total_pages - done, 0):.1f}s", file=sys.stderr)
+
+    def report(self):
+        return {
+            "url_path": self.url_path.name if self.url_path is not None else None,
+            "gender": self.gender.name if self.gender is not None else None,
+            "seconds": time.perf_counter() - self.start,
+            "rows": sum(record["rows"] for record in self.pages),
+            "phases": self.phases,
+            "columns": self.columns,
+            "counters": self.counters,
+            "pages": self.pages
+        }
+
+    def summary(self):
+        report = self.report()
+        phases = sorted(report["phases"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+        breakdown = ", ".join(f"{name} {entry['seconds']:.2f}s" for name, entry in phases)
+        return f"Scraped {len([record for record in self.pages if record['rows'] > 0])} pages ({report['rows']} rows) in {report['seconds']:.2f}s: {breakdown}"
+
+    def write(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+# Content-addressed store of everything the scraper reads from the site: each value is written once under
+# objects/ named by the sha256 of its JSON, refs/ maps the sha256 of a key (e.g. ("column", url, column)) onto it
+class ScrapeSnapshot:
+    def __init__(self, directory, mode=SnapshotMode.RECORD, ttl=None, max_size=None):
+        if not isinstance(directory, str):
+            raise TypeError(f"Expected string for directory, but received {type(directory)}")
+        if not isinstance(mode, SnapshotMode):
+            raise TypeError("mode must be an enumeration member of type SnapshotMode")
+        if ttl is not None:
+            if not isinstance(ttl, (int, float)):
+                raise TypeError(f"Expected integer or float for ttl, but received {type(ttl)}")
+            if ttl <= 0:
+                raise ValueError(f"Expected positive value (seconds) for ttl, but received {ttl}")
+        if max_size is not None:
+            if not isinstance(max_size, int):
+                raise TypeError(f"Expected integer for max_size, but received {type(max_size)}")
+            if max_size < 1:
+                raise ValueError(f"Expected positive value (bytes) for max_size, but received {max_size}")
+        self.directory = directory
+        self.mode = mode
+        self.ttl = ttl
+        self.max_size = max_size
+        self.reads = 0
+        self.writes = 0
+
+    @staticmethod
+    def _getDigest(data):
+        return hashlib.sha256(data).hexdigest()
+
+    def _getPath(self, kind, digest):
+        return os.path.join(self.directory, kind, digest[:2], f"{digest}.json")
+
+    def _getRefPath(self, key):
+        return self._getPath("refs", self._getDigest(json.dumps(key).encode()))
+
+    @staticmethod
+    def _writeFile(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", 'wb') as f:
+            f.write(data)
+        os.replace(f"{path}.tmp", path)
+
+    @staticmethod
+    def _readJson(path):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _isExpired(self, ref):
+        return self.ttl is not None and time.time() - ref["time"] > self.ttl
+
+    def get(self, key):
+        ref = self._readJson(self._getRefPath(key))
+        if ref is not None and not self._isExpired(ref):
+            value = self._readJson(self._getPath("objects", ref["object"]))
+            if value is not None:
+                self.reads += 1
+                return value
+        raise RuntimeError(f"{key} is not in the snapshot at {self.directory}")
+
+    def put(self, key, value):
+        data = json.dumps(value).encode()
+        digest = self._getDigest(data)
+        path = self._getPath("objects", digest)
+        # Identical extracts, e.g. a column that did not change, are stored once
+        if not os.path.exists(path):
+            self._writeFile(path, data)
+        self._writeFile(self._getRefPath(key), json.dumps({"key": key, "object": digest, "time": time.time()}).encode())
+        self.writes += 1
+
+    def _listFiles(self, kind):
+        for root, _, files in os.walk(os.path.join(self.directory, kind)):
+            for name in files:
+                if name.endswith(".json"):
+                    yield os.path.join(root, name)
+
+    # Drops expired refs, then the oldest refs until the objects fit into max_size,
+    # and finally every object no ref points to; returns the number of refs dropped
+    def evict(self):
+        refs = []
+        dropped = 0
+        for path in self._listFiles("refs"):
+            ref = self._readJson(path)
+            if ref is None or self._isExpired(ref):
+                os.remove(path)
+                dropped += 1
+            else:
+                refs.append((ref["time"], path, ref["object"]))
+        sizes = {}
+        for path in self._listFiles("objects"):
+            sizes[os.path.basename(path)[:-len(".json")]] = os.path.getsize(path)
+        counts = {}
+        for _, _, digest in refs:
+            counts[digest] = counts.get(digest, 0) + 1
+        total = sum(size for digest, size in sizes.items() if digest in counts)
+        refs.sort()
+        while self.max_size is not None and total > self.max_size and len(refs) > 0:
+            _, path, digest = refs.pop(0)
+            os.remove(path)
+            dropped += 1
+            counts[digest] -= 1
+            if counts[digest] == 0:
+                total -= sizes.get(digest, 0)
+        for digest in sizes:
+            if counts.get(digest, 0) == 0:
+                os.remove(self._getPath("objects", digest))
+        return dropped
+
+# Runs scrapes of the scraper class as lanes, threads that each own one tab of its browser and take turns:
+# only the lane holding the turn runs, it hands the turn on once it has started loading a page, so the
+# pages of the other lanes load while one of them is read. The per-scrape class variables are swapped
+# in and out with the turn
+class _TabScheduler:
+    # The tab of a lane outlives the scrapes it runs
+    _lane_variables = ("_tab_browser", "_tab_lane")
+
+    def __init__(self, scraper, lanes):
+        self._scraper = scraper
+        self._variables = tuple(scraper._getScrapeDefaults()) + self._lane_variables
+        self._lanes = lanes
+        self._condition = threading.Condition()
+        self._ready = deque()
+        self._states = {}
+        self._turn = None
+
+    def _getState(self):
+        return {name: getattr(self._scraper, name) for name in self._variables}
+
+    def _setState(self, state):
+        for name, value in state.items():
+            setattr(self._scraper, name, value)
+
+    def _waitTurn(self, lane):
+        while self._turn != lane:
+            self._condition.wait()
+
+    def _acquire(self, lane):
+        with self._condition:
+            self._waitTurn(lane)
+        self._setState(self._states[lane])
+
+    def _release(self, lane):
+        del self._states[lane]
+        with self._condition:
+            self._turn = self._ready.popleft() if len(self._ready) > 0 else None
+            self._condition.notify_all()
+
+    # Called by the lane holding the turn, returns once the turn has come back to it
+    def switch(self):
+        lane = self._turn
+        self._states[lane] = self._getState()
+        with self._condition:
+            self._ready.append(lane)
+            self._turn = self._ready.popleft()
+            self._condition.notify_all()
+            self._waitTurn(lane)
+        self._setState(self._states[lane])
+
+    def _runLane(self, lane, calls, finish):
+        self._acquire(lane)
+        try:
+            # Only the lane holding the turn takes calls off the queue
+            while len(calls) > 0:
+                index, call = calls.popleft()
+                try:
+                    result, error = call(), None
+                except Exception as e:
+                    result, error = None, e
+                finish(index, result, error)
+            self._scraper._closeLaneTab()
+        finally:
+            self._release(lane)
+
+    # Runs every call on at most lanes lanes, finish(index, result, error) is called as each one ends
+    def run(self, calls, finish):
+        initial = self._getState()
+        queue = deque(enumerate(calls))
+        threads = []
+        for lane in range(min(self._lanes, len(queue))):
+            self._states[lane] = dict(initial)
+            threads.append(threading.Thread(target=self._runLane, args=(lane, queue, finish), name=f"tab-lane-{lane}", daemon=True))
+        # Every lane is queued up front, so the first switch already hands the turn on
+        lanes = deque(range(len(threads)))
+        self._turn = lanes.popleft() if len(lanes) > 0 else None
+        self._ready = lanes
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self._setState(initial)
+
+class ScraperSingleton:
+    _backend = Backend.SELENIUM
+    _blocked_resources = frozenset(BlockedResource)
+    _browser = None
+    _browser_pages = 0
+    _browser_peak_rss = 0
+    _browser_sessions = 0
+    _chromium_location = "/usr/bin/chromium"    # SHOULD NOT BE MODIFIED
+    _column_filter_dict = None
+    _column_order = None
+    _domain = "runrepeat.com"                   # SHOULD NOT BE MODIFIED
+    _driver_path = "/usr/bin/chromedriver"      # SHOULD NOT BE MODIFIED
+    _fingerprint_columns = None
+    _fingerprint_directory = None
+    _fingerprint_stats = None
+    _gender_membership = None
+    _http_timeout = 10
+    _js_heap_size = 512                         # V8 old space limit of the renderer in MB, None for Chromium's default
+    _journal = None
+    _journal_end = None
+    _journal_filename = None
+    _journal_max_age = 6 * 3600                 # Seconds a journal left by a failed scrape is resumed for, None to always resume
+    _journal_records = None
+    _max_browser_rss = 1536                     # Browser RSS in MB above which it is restarted, None to disable
+    _metrics = _ScrapeMetrics()
+    _page_url = None
+    _performance_log = False
+    _pipeline_depth = 2
+    _pipeline_workers = 2
+    _pool_connections = 4
+    _pool_maxsize = 16
+    _profile_directory = None
+    _recycle_pages = 200                        # Pages rendered before the browser is restarted, None to disable
+    _serializer_executor = None
+    _session = None
+    _single_pass = False
+    _rerender_latency = None
+    _rerender_timeouts = 0
+    _sleep = 0
+    _slim_list_view = False
+    _snapshot = None
+    _tab_browser = None                         # Browser the tab of a lane was opened in
+    _tab_current = None
+    _tab_handles = None
+    _tab_lane = None
+    _tab_load_timeout = 30                      # Seconds a page loading in a background tab is waited for
+    _tab_queue = ()
+    _tab_scheduler = None
+    _tab_urls = None
+    _tabs = 1
+    _timeout = 1
+    _url = f"https://{_domain}"
+    _user_agent = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36"
+    _wait_time = 0.0
+
+    # Scrolls arguments[0] into view and, if arguments[1] is set, arms an observer that fires
+    # once a facts column of the slim list is added, removed or changed
+    _scroll_script = """
+        arguments[0].scrollIntoView({block: 'center', inline: 'center'});
+        if (arguments[1]) {
+            const facts = 'div.catalog-list-slim__facts__column';
+            const isColumn = (node) => node.nodeType === 1 && (node.matches(facts) || node.querySelector(facts) !== null);
+            if (window.__shoeExpertObserver) {
+                window.__shoeExpertObserver.disconnect();
+            }
+            window.__shoeExpertRerendered = false;
+            window.__shoeExpertObserver = new MutationObserver((records) => {
+                const rerendered = records.some((record) => {
+                    // characterData records target the text node, a column patched in place is found through its parent
+                    const node = record.target.nodeType === 1 ? record.target : record.target.parentElement;
+                    return (node !== null && node.closest(facts) !== null) ||
+                        Array.from(record.addedNodes).some(isColumn) ||
+                        Array.from(record.removedNodes).some(isColumn);
+                });
+                if (rerendered) {
+                    window.__shoeExpertObserver.disconnect();
+                    window.__shoeExpertRerendered = true;
+                    if (window.__shoeExpertResolve) {
+                        window.__shoeExpertResolve(true);
+                    }
+                }
+            });
+            window.__shoeExpertObserver.observe(document.body, {childList: true, subtree: true, characterData: true});
+        }
+    """
+
+    # Resolves true as soon as the armed observer fires, or false after arguments[0] milliseconds
+    _rerender_script = """
+        const done = arguments[arguments.length - 1];
+        if (window.__shoeExpertRerendered) {
+            done(true);
+            return;
+        }
+        const timer = setTimeout(() => {
+            window.__shoeExpertResolve = null;
+            done(false);
+        }, arguments[0]);
+        window.__shoeExpertResolve = (rerendered) => {
+            clearTimeout(timer);
+            window.__shoeExpertResolve = null;
+            done(rerendered);
+        };
+    """
+
+    # Status of the last navigation, 0 where the browser does not report it
+    # Navigates without waiting for the load, the flag only exists until the next document replaces this one
+    _navigate_script = "window.__shoeExpertNavigating = true; window.location.href = arguments[0];"
+    _navigation_done_script = "return window.__shoeExpertNavigating !== true && document.readyState === 'complete';"
+    _response_status_script = "const navigation = performance.getEntriesByType('navigation')[0]; return navigation && navigation.responseStatus ? navigation.responseStatus : 0;"
+
+    # Returns the shoe names and the text of every rendered facts column (in render order) in one round trip,
+    # shaped like the attributes of _CatalogPageParser
+    _page_script = """
+        const text = (element) => (element.innerText || element.textContent || '').trim();
+        const values = 'div.catalog-list-slim__shoes-fact__values';
+        return {
+            names: Array.from(document.querySelectorAll('a.catalog-list-slim__names'), text),
+            facts: Array.from(document.querySelectorAll('div.catalog-list-slim__facts__column'), (column) => ({
+                span: Array.from(column.querySelectorAll(`${values} span`), text),
+                score: Array.from(column.querySelectorAll(`${values}.corescore__values div.corescore div.corescore__score.score_green`), text)
+            }))
+        };
+    """
+
+    # Returns [id, checked] for every column checkbox in menu (and therefore render) order
+    _column_state_script = "return Array.from(document.querySelectorAll(\"input[type='checkbox'][id^='fact-']\"), (input) => [input.id, input.checked]);"
+
+    @classmethod
+    def _cleanup(cls):
+        cls._quitBrowser()
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
+
+    # Class variables that only live for one scrape with their values between scrapes, restored by
+    # _resetClassVariables and kept apart for every lane of a _TabScheduler. The others are shared by the
+    # lanes on purpose: the browser with its session counters, _performance_log and _slim_list_view describe
+    # the one browser, _rerender_latency is learned from the site across scrapes, the rest is configuration
+    @classmethod
+    def _getScrapeDefaults(cls):
+        return {
+            "_backend": Backend.SELENIUM,
+            "_column_filter_dict": None,
+            "_column_order": None,
+            "_fingerprint_columns": None,
+            "_fingerprint_directory": None,
+            "_fingerprint_stats": None,
+            "_gender_membership": None,
+            "_journal": None,
+            "_journal_end": None,
+            "_journal_filename": None,
+            "_journal_records": None,
+            "_metrics": _ScrapeMetrics(),
+            "_page_url": None,
+            "_rerender_timeouts": 0,
+            "_serializer_executor": None,
+            "_single_pass": False,
+            "_sleep": 0,
+            "_snapshot": None,
+            "_tab_current": None,
+            "_tab_handles": None,
+            "_tab_queue": (),
+            "_tab_urls": None,
+            "_tabs": 1,
+            "_timeout": 1,
+            "_url": f"https://{cls._domain}",
+            "_wait_time": 0.0
+        }
+
+    # The journal, fingerprints, serializer and tabs are closed by scrape before, resetting them only drops the references
+    @classmethod
+    def _resetClassVariables(cls):
+        for name, value in cls._getScrapeDefaults().items():
+            setattr(cls, name, value)
+        # The next scrape checks the view again
+        cls._slim_list_view = False
+
+    @classmethod
+    def _getPageSnapshot(cls):
+        with cls._metrics.phase("extraction"):
+            return cls._browser.execute_script(cls._page_script)
+
+    @classmethod
+    def _getShoeNames(cls):
+        if cls._isReplaying():
+            shoe_names = cls._snapshot.get(("names", cls._page_url))
+        else:
+            shoe_names = cls._getPageSnapshot()['names']
+            if cls._snapshot is not None:
+                cls._snapshot.put(("names", cls._page_url), shoe_names)
+        if len(shoe_names) > 0:
+            return shoe_names
+        return None
+
+    @classmethod
+    def _applyColumns(cls, rerender=True):
+        cls._scroll_and_click(selector=(By.CSS_SELECTOR, "button.buy_now_button[data-v-795eb1ee]"), rerender=rerender)
+
+    @classmethod
+    def _editColumns(cls):
+        cls._scroll_and_click(selector=(By.CSS_SELECTOR, "button.buy_now_button.edit-columns__button"))
+
+    @classmethod
+    def _getColumnFilterDict(cls, url_path):
+        if cls._column_filter_dict is None:
+            cls._column_filter_dict = url_path.get_default_dict().copy()
+        return cls._column_filter_dict
+
+    @classmethod
+    def _getEmptyView(cls, url_path):
+        checkboxes = None
+        filter_dict = cls._getColumnFilterDict(url_path=url_path)
+        if filter_dict != url_path.get_false_dict():
+            for key, value in filter_dict.items():
+                if value:
+                    if checkboxes is None:
+                        checkboxes = []
+                    checkboxes.append(key.get_menu_selector())
+            if checkboxes is not None:
+                cls._editColumns()
+                for selector in checkboxes:
+                    try:
+                        cls._scroll_and_click(selector=selector)
+                    except TimeoutException:
+                        print(f"Timeout exceeded for selector {selector}", file=sys.stderr)
+                cls._applyColumns()
+            cls._setColumnFilterDict(url_path=url_path, dict=url_path.get_false_dict())
+
+    @classmethod
+    def _getSingleColumnView(cls, column, url_path):
+        if not isinstance(column, ColumnSelector):
+            raise TypeError(f"Expected ColumnSelector enumeration member, but received {type(column)}")
+        cls._getEmptyView(url_path)
+        cls._editColumns()
+        try:
+            cls._scroll_and_click(selector=column.get_menu_selector())
+        except TimeoutException:
+            print(f"Timeout exceeded for selector {column.get_menu_selector()}", file=sys.stderr)
+        cls._applyColumns()
+        map = url_path.get_false_dict().copy()
+        map[column] = True
+        cls._setColumnFilterDict(url_path=url_path, dict=map)
+
+    # Reads the checkbox state from the DOM, returns False if the column menu is not rendered
+    @classmethod
+    def _syncColumnFilterDict(cls, url_path):
+        with cls._metrics.phase("extraction"):
+            states = cls._browser.execute_script(cls._column_state_script)
+        if not states:
+            return False
+        order = []
+        map = {}
+        available = url_path.get_available_columns()
+        for id, checked in states:
+            try:
+                column = ColumnSelector(id)
+            except ValueError:
+                continue
+            order.append(column)
+            if column in available:
+                map[column] = bool(checked)
+        cls._column_order = order
+        cls._setColumnFilterDict(url_path=url_path, dict=map)
+        return True
+
+    @classmethod
+    def _getMultiColumnView(cls, columnlist, url_path):
+        editing = False
+        if not cls._syncColumnFilterDict(url_path):
+            cls._editColumns()
+            editing = True
+            cls._syncColumnFilterDict(url_path)
+        filter_dict = cls._getColumnFilterDict(url_path=url_path)
+        # Columns already shown are left on and skipped when reading, only missing ones are switched on
+        toggles = [column for column in columnlist if not filter_dict[column]]
+        map = {column: True for column in toggles}
+        if len(toggles) > 0:
+            if not editing:
+                cls._editColumns()
+                editing = True
+            for column in toggles:
+                try:
+                    cls._scroll_and_click(selector=column.get_menu_selector())
+                except TimeoutException:
+                    print(f"Timeout exceeded for selector {column.get_menu_selector()}", file=sys.stderr)
+        if editing:
+            cls._applyColumns(rerender=len(toggles) > 0)
+        cls._setColumnFilterDict(url_path=url_path, dict=map)
+
+    # Raw texts of column across facts (entries of _page_script or _CatalogPageParser), N/A for every shoe if empty
+    @staticmethod
+    def _getFactTexts(column, facts, page_name_list):
+        key = 'score' if column == ColumnSelector.SCORE else 'span'
+        texts = [text for fact in facts for text in fact[key]]
+        if len(texts) < 1:
+            texts = ['N/A' for _ in page_name_list]
+        return texts
+
+    @classmethod
+    def _serializeColumn(cls, column, url_path, texts):
+        parser = url_path.get_column_parser(column)
+        with cls._metrics.phase("serialization", column=column):
+            return parser.parse(texts)
+
+    @classmethod
+    def _serializeColumns(cls, columnlist, url_path, texts_list):
+        return [cls._serializeColumn(column, url_path, texts) for column, texts in zip(columnlist, texts_list)]
+
+    # Serialized columns, or a Future of them in a pipelined scrape so the browser can move on
+    @classmethod
+    def _submitSerialization(cls, columnlist, url_path, texts_list):
+        if cls._serializer_executor is None:
+            return cls._serializeColumns(columnlist, url_path, texts_list)
+        return cls._serializer_executor.submit(cls._serializeColumns, columnlist, url_path, texts_list)
+
+    # Enables every column in columnlist at once and reads the whole table in one pass,
+    # returns None if the rendered table cannot be matched against the column menu
+    @classmethod
+    def _getMultiColumnTexts(cls, columnlist, url_path, page_name_list):
+        cls._getMultiColumnView(columnlist, url_path)
+        if cls._column_order is None:
+            return None
+        filter_dict = cls._getColumnFilterDict(url_path=url_path)
+        rendered = [column for column in cls._column_order if filter_dict.get(column, False)]
+        facts = cls._getPageSnapshot()['facts']
+        if any(column not in rendered for column in columnlist) or len(facts) != len(rendered):
+            return None
+        column_texts = {}
+        for column, fact in zip(rendered, facts):
+            if column in columnlist:
+                column_texts[column] = cls._getFactTexts(column, [fact], page_name_list)
+        return [column_texts[column] for column in columnlist]
+
+    # Raw texts of every column in columnlist for the loaded page, one list per column
+    @classmethod
+    def _getPageColumnTexts(cls, columnlist, url_path, page_name_list):
+        if cls._isReplaying():
+            return [cls._snapshot.get(("column", cls._page_url, column.value)) for column in columnlist]
+        texts_list = None
+        if cls._single_pass:
+            texts_list = cls._getMultiColumnTexts(columnlist, url_path, page_name_list)
+            if texts_list is None:
+                print(f"Single-pass extraction failed for {cls._browser.current_url}, falling back to one column at a time", file=sys.stderr)
+        if texts_list is None:
+            texts_list = []
+            for column in columnlist:
+                if not isinstance(column, ColumnSelector):
+                    raise TypeError(f"Expected ColumnSelector enumeration member, but received {type(column)}")
+                with cls._metrics.column(column):
+                    cls._getSingleColumnView(column, url_path)
+                    texts_list.append(cls._getFactTexts(column, cls._getPageSnapshot()['facts'], page_name_list))
+        if cls._snapshot is not None:
+            for column, texts in zip(columnlist, texts_list):
+                cls._snapshot.put(("column", cls._page_url, column.value), texts)
+        return texts_list
+
+    @classmethod
+    def _mountAdapter(cls, session):
+        adapter = HTTPAdapter(pool_connections=cls._pool_connections, pool_maxsize=cls._pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    # Keep-alive session shared by every HTTP request of the scraper
+    @classmethod
+    def _getSession(cls):
+        if cls._session is None:
+            session = requests.Session()
+            cls._mountAdapter(session)
+            session.headers["User-Agent"] = cls._user_agent
+            # Same view that _getSlimListView selects in the browser
+            session.cookies.set("list_type", "slim", domain=cls._domain)
+            cls._session = session
+        return cls._session
+
+    @staticmethod
+    def _parseCatalogPage(html):
+        parser = _CatalogPageParser()
+        parser.feed(html)
+        parser.close()
+        return parser
+
+    # Maps a parsed page onto columnlist, returns (names, {column: raw text list}) where
+    # columns that are not rendered server-side are left out, or None if the page cannot be mapped
+    @classmethod
+    def _mapCatalogPage(cls, parser, columnlist):
+        if len(parser.names) == 0 or len(parser.states) == 0:
+            return None
+        rendered = []
+        for id, checked in parser.states:
+            if checked:
+                try:
+                    rendered.append(ColumnSelector(id))
+                except ValueError:
+                    rendered.append(None)
+        if len(rendered) != len(parser.facts):
+            return None
+        column_data = {}
+        for column, fact in zip(rendered, parser.facts):
+            if column in columnlist:
+                column_data[column] = cls._getFactTexts(column, [fact], parser.names)
+        return (parser.names, column_data)
+
+    # Returns (names, data) like _getBrowserPageData, or None when the page has to be scraped through Selenium
+    @classmethod
+    def _getHttpPageData(cls, page, url, columnlist, url_path):
+        response = cls._fetchPage(url)
+        if response is None:
+            return None
+        status, html = response
+        if status >= 400:
+            return (None, None)
+        with cls._metrics.phase("parsing"):
+            parser = cls._parseCatalogPage(html)
+        mapped = cls._mapCatalogPage(parser, columnlist)
+        if mapped is None:
+            return None
+        page_name_list, column_data = mapped
+        cached_data = cls._getFingerprintData(page, page_name_list)
+        if cached_data is not None:
+            return (page_name_list, cached_data)
+        missing = [column for column in columnlist if column not in column_data]
+        if len(missing) > 0:
+            cls._loadBrowserPage(url, url_path)
+            if cls._getShoeNames() != page_name_list:
+                return None
+            column_data.update(zip(missing, cls._getPageColumnTexts(missing, url_path, page_name_list)))
+        return (page_name_list, cls._submitSerialization(columnlist, url_path, [column_data[column] for column in columnlist]))
+
+    # The first list of objects that all carry a name and their facts, i.e. the products of a catalog data response
+    @classmethod
+    def _findCatalogProducts(cls, data):
+        if isinstance(data, list):
+            if len(data) > 0 and all(isinstance(item, dict) and isinstance(item.get("name"), str) and isinstance(item.get("facts"), dict) for item in data):
+                return data
+            items = data
+        elif isinstance(data, dict):
+            items = data.values()
+        else:
+            return None
+        for item in items:
+            products = cls._findCatalogProducts(item)
+            if products is not None:
+                return products
+        return None
+
+    # Text the slim list renders for a fact value of a data response
+    @classmethod
+    def _getCatalogJsonText(cls, value):
+        if value is None:
+            return 'N/A'
+        if isinstance(value, bool):
+            return 'Yes' if value else 'No'
+        if isinstance(value, list):
+            return ', '.join(cls._getCatalogJsonText(item) for item in value)
+        return ' '.join(str(value).split())
+
+    # Maps a catalog data response onto columnlist like _mapCatalogPage: the fact of a column is looked up
+    # by its id without the fact- prefix in the product's facts, then on the product itself; columns
+    # missing from any product are left out, returns None if the response holds no products
+    @classmethod
+    def _mapCatalogJson(cls, data, columnlist):
+        products = cls._findCatalogProducts(data)
+        if products is None:
+            return None
+        page_name_list = [' '.join(product["name"].split()) for product in products]
+        column_data = {}
+        for column in columnlist:
+            key = column.value[len('fact-'):]
+            texts = []
+            for product in products:
+                if key in product["facts"]:
+                    texts.append(cls._getCatalogJsonText(product["facts"][key]))
+                elif key in product:
+                    texts.append(cls._getCatalogJsonText(product[key]))
+                else:
+                    break
+            else:
+                column_data[column] = texts
+        return (page_name_list, column_data)
+
+    # Waits up to _timeout for a JSON response of the loaded page that holds the catalog products
+    @classmethod
+    def _captureCatalogJson(cls):
+        if cls._isReplaying():
+            return cls._snapshot.get(("xhr", cls._page_url))
+        deadline = time.perf_counter() + cls._timeout
+        responses = set()
+        data = None
+        with cls._metrics.phase("xhr"):
+            while data is None:
+                for entry in cls._browser.get_log("performance"):
+                    message = json.loads(entry["message"])["message"]
+                    params = message.get("params", {})
+                    if message["method"] == "Network.responseReceived" and "json" in params["response"].get("mimeType", ""):
+                        responses.add(params["requestId"])
+                    elif message["method"] == "Network.loadingFinished" and params["requestId"] in responses:
+                        try:
+                            body = cls._browser.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+                            text = base64.b64decode(body["body"]).decode() if body["base64Encoded"] else body["body"]
+                            candidate = json.loads(text)
+                        except (WebDriverException, ValueError):
+                            continue
+                        if cls._findCatalogProducts(candidate) is not None:
+                            data = candidate
+                            break
+                if data is None:
+                    if time.perf_counter() >= deadline:
+                        return None
+                    time.sleep(0.05)
+        if cls._snapshot is not None:
+            cls._snapshot.put(("xhr", cls._page_url), data)
+        return data
+
+    # Returns (names, data) like _getBrowserPageData from the data responses the catalog loads for itself,
+    # or None when the page has to be read through the DOM
+    @classmethod
+    def _getXhrPageData(cls, page, url, columnlist, url_path):
+        if not cls._isReplaying():
+            # Events of earlier pages
+            cls._ensureBrowser()
+            cls._browser.get_log("performance")
+        cls._loadBrowserPage(url, url_path)
+        if cls._getPageStatus() >= 400:
+            return (None, None)
+        data = cls._captureCatalogJson()
+        if data is None:
+            print(f"No catalog data response captured for {url}, reading the page through the DOM", file=sys.stderr)
+            return None
+        page_name_list, column_data = cls._mapCatalogJson(data, columnlist)
+        cached_data = cls._getFingerprintData(page, page_name_list)
+        if cached_data is not None:
+            return (page_name_list, cached_data)
+        missing = [column for column in columnlist if column not in column_data]
+        if len(missing) > 0:
+            if cls._getShoeNames() != page_name_list:
+                return None
+            column_data.update(zip(missing, cls._getPageColumnTexts(missing, url_path, page_name_list)))
+        return (page_name_list, cls._submitSerialization(columnlist, url_path, [column_data[column] for column in columnlist]))
+
+    # Returns (status, html) of url, or None if the request failed
+    @classmethod
+    def _fetchPage(cls, url):
+        if cls._isReplaying():
+            return tuple(cls._snapshot.get(("http", url)))
+        cls._metrics.count("http_requests")
+        try:
+            with cls._metrics.phase("http"):
+                response = cls._getSession().get(url, timeout=cls._http_timeout)
+        except requests.RequestException as e:
+            print(f"HTTP request failed for {url}: {e}", file=sys.stderr)
+            return None
+        if cls._snapshot is not None:
+            cls._snapshot.put(("http", url), [response.status_code, response.text])
+        return (response.status_code, response.text)
+
+    # Status of the navigation to the loaded page
+    @classmethod
+    def _getPageStatus(cls):
+        if cls._isReplaying():
+            return cls._snapshot.get(("status", cls._page_url))
+        status = cls._browser.execute_script(cls._response_status_script)
+        if cls._snapshot is not None:
+            cls._snapshot.put(("status", cls._page_url), status)
+        return status
+
+    @classmethod
+    def _isReplaying(cls):
+        return cls._snapshot is not None and cls._snapshot.mode is SnapshotMode.REPLAY
+
+    @classmethod
+    def _loadBrowserPage(cls, url, url_path):
+        cls._page_url = url
+        if cls._isReplaying():
+            return
+        cls._checkBrowserSession()
+        if not cls._slim_list_view:
+            cls._getSlimListView()
+        if cls._tab_scheduler is not None:
+            cls._loadLaneTab(url)
+        elif cls._tabs > 1:
+            cls._loadTab(url)
+        else:
+            with cls._metrics.phase("navigation"):
+                cls._browser.get(url)
+        cls._setColumnFilterDict(url_path=url_path, dict=url_path.get_default_dict())
+
+    # Opens the tabs missing from the _tabs of the current browser, the first one is the tab it started with
+    @classmethod
+    def _openTabs(cls):
+        if cls._tab_handles is None:
+            cls._tab_current = cls._browser.current_window_handle
+            cls._tab_handles = [cls._tab_current]
+            cls._tab_urls = {}
+        current = cls._tab_current
+        while len(cls._tab_handles) < cls._tabs:
+            cls._browser.switch_to.new_window('tab')
+            cls._tab_handles.append(cls._browser.current_window_handle)
+        cls._switchTab(current)
+
+    @classmethod
+    def _switchTab(cls, handle):
+        cls._browser.switch_to.window(handle)
+        cls._tab_current = handle
+
+    # Switches to the tab that has been loading url in the background, or loads it in the current tab,
+    # then starts loading the pages of _tab_queue in the tabs left idle
+    @classmethod
+    def _loadTab(cls, url):
+        if cls._tab_handles is None or len(cls._tab_handles) < cls._tabs:
+            cls._openTabs()
+        handle = next((handle for handle, tab_url in cls._tab_urls.items() if tab_url == url), None)
+        with cls._metrics.phase("navigation"):
+            if handle is None:
+                cls._browser.get(url)
+            else:
+                del cls._tab_urls[handle]
+                cls._switchTab(handle)
+                try:
+                    WebDriverWait(driver=cls._browser, timeout=cls._tab_load_timeout, poll_frequency=0.05).until(lambda browser: browser.execute_script(cls._navigation_done_script))
+                    cls._metrics.count("prefetched_pages")
+                except TimeoutException:
+                    print(f"Timed out loading {url} in a background tab, reloading it", file=sys.stderr)
+                    cls._browser.get(url)
+        cls._prefetchTabs()
+
+    @classmethod
+    def _prefetchTabs(cls):
+        # Tabs loading a page that is no longer coming up are reused
+        cls._tab_urls = {handle: url for handle, url in cls._tab_urls.items() if url in cls._tab_queue}
+        idle = [handle for handle in cls._tab_handles if handle != cls._tab_current and handle not in cls._tab_urls]
+        queued = [url for url in cls._tab_queue if url not in cls._tab_urls.values()]
+        if len(idle) == 0 or len(queued) == 0:
+            return
+        current = cls._tab_current
+        for handle, url in zip(idle, queued):
+            cls._switchTab(handle)
+            cls._browser.execute_script(cls._navigate_script, url)
+            cls._tab_urls[handle] = url
+        cls._switchTab(current)
+
+    # Closes every tab but the first so the browser is left as a single tab scrape expects it
+    @classmethod
+    def _closeTabs(cls):
+        if cls._browser is not None and cls._tab_handles is not None and len(cls._tab_handles) > 1:
+            try:
+                for handle in cls._tab_handles[1:]:
+                    cls._switchTab(handle)
+                    cls._browser.close()
+                cls._switchTab(cls._tab_handles[0])
+            except WebDriverException as e:
+                print(f"Could not close the background tabs: {e}", file=sys.stderr)
+        cls._tab_current = None
+        cls._tab_handles = None
+        cls._tab_urls = None
+
+    # Switches to the tab of the lane holding the turn, opening it in a browser started since
+    @classmethod
+    def _openLaneTab(cls):
+        if cls._tab_browser is not cls._browser:
+            cls._browser.switch_to.new_window('tab')
+            cls._tab_lane = cls._browser.current_window_handle
+            cls._tab_browser = cls._browser
+        cls._switchTab(cls._tab_lane)
+
+    # Starts loading url in the tab of the lane and hands the turn on until the other lanes have started theirs
+    @classmethod
+    def _loadLaneTab(cls, url):
+        cls._openLaneTab()
+        cls._browser.execute_script(cls._navigate_script, url)
+        cls._tab_scheduler.switch()
+        # Another lane restarted the browser in the meantime
+        while cls._tab_browser is not cls._browser:
+            if cls._slim_list_view:
+                cls._openLaneTab()
+            else:
+                cls._getSlimListView()
+            cls._browser.execute_script(cls._navigate_script, url)
+            cls._tab_scheduler.switch()
+        cls._switchTab(cls._tab_lane)
+        with cls._metrics.phase("navigation"):
+            try:
+                WebDriverWait(driver=cls._browser, timeout=cls._tab_load_timeout, poll_frequency=0.05).until(lambda browser: browser.execute_script(cls._navigation_done_script))
+            except TimeoutException:
+                print(f"Timed out loading {url} in a background tab, reloading it", file=sys.stderr)
+                cls._browser.get(url)
+
+    @classmethod
+    def _closeLaneTab(cls):
+        if cls._browser is not None and cls._tab_browser is cls._browser:
+            try:
+                cls._switchTab(cls._tab_lane)
+                cls._browser.close()
+                cls._switchTab(cls._browser.window_handles[0])
+            except WebDriverException as e:
+                print(f"Could not close the tab of a lane: {e}", file=sys.stderr)
+        cls._tab_browser = None
+        cls._tab_current = None
+        cls._tab_lane = None
+
+    # Runs calls, each a scrape of this class, as lanes on at most lanes tabs of the one browser,
+    # finish(index, result, error) is called as each one ends
+    @classmethod
+    def _runTabJobs(cls, calls, lanes, finish):
+        if cls._tab_scheduler is not None:
+            raise RuntimeError("Tab jobs cannot be started from a tab job")
+        cls._tab_scheduler = _TabScheduler(cls, lanes)
+        try:
+            cls._tab_scheduler.run(calls, finish)
+        finally:
+            cls._tab_scheduler = None
+
+    # Returns (names, data) for a page, or (None, None) past the last page of the catalog
+    @classmethod
+    def _getBrowserPageData(cls, page, url, columnlist, url_path):
+        cls._loadBrowserPage(url, url_path)
+        if cls._getPageStatus() >= 400:
+            return (None, None)
+        page_name_list = cls._getShoeNames()
+        if page_name_list is None:
+            return (None, None)
+        cached_data = cls._getFingerprintData(page, page_name_list)
+        if cached_data is not None:
+            return (page_name_list, cached_data)
+        return (page_name_list, cls._submitSerialization(columnlist, url_path, cls._getPageColumnTexts(columnlist, url_path, page_name_list)))
+
+    @staticmethod
+    def _getFingerprint(page_name_list):
+        return hashlib.sha256("\n".join(page_name_list).encode()).hexdigest()
+
+    # Cache of the previous run's rows keyed by (Url_Paths, Gender, page), a page is reused
+    # without extracting any column when its list of shoe names has not changed
+    @classmethod
+    def _openFingerprints(cls, cache_dir, url_path, gender, columnlist):
+        if not isinstance(cache_dir, str):
+            raise TypeError("cache_dir must be a string")
+        cls._fingerprint_directory = os.path.join(cache_dir, f"{url_path.name.lower()}_{gender.name.lower()}")
+        cls._fingerprint_columns = [column.value for column in columnlist]
+        cls._fingerprint_stats = {"reused": 0, "extracted": 0}
+        os.makedirs(cls._fingerprint_directory, exist_ok=True)
+
+    @classmethod
+    def _getFingerprintData(cls, page, page_name_list):
+        if cls._fingerprint_directory is None:
+            return None
+        filename = os.path.join(cls._fingerprint_directory, f"{page}.json")
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r') as f:
+                    entry = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Ignoring unreadable fingerprint cache {filename}: {e}", file=sys.stderr)
+            else:
+                if entry["columns"] == cls._fingerprint_columns and entry["fingerprint"] == cls._getFingerprint(page_name_list):
+                    cls._fingerprint_stats["reused"] += 1
+                    cls._metrics.count("fingerprint_pages")
+                    return entry["values"]
+        cls._fingerprint_stats["extracted"] += 1
+        return None
+
+    # One file per page keeps memory constant, each is replaced atomically as soon as its page is finished
+    @classmethod
+    def _recordFingerprint(cls, page, page_name_list, tmp_outer_list):
+        if cls._fingerprint_directory is not None:
+            filename = os.path.join(cls._fingerprint_directory, f"{page}.json")
+            with open(f"{filename}.tmp", 'w') as f:
+                json.dump({"columns": cls._fingerprint_columns, "fingerprint": cls._getFingerprint(page_name_list), "values": tmp_outer_list}, f)
+            os.replace(f"{filename}.tmp", filename)
+
+    @classmethod
+    def _closeFingerprints(cls, report=False):
+        if report and cls._fingerprint_stats is not None:
+            stats = cls._fingerprint_stats
+            print(f"Fingerprint cache: {stats['reused']} pages reused, {stats['extracted']} pages re-extracted", file=sys.stderr)
+        cls._fingerprint_columns = None
+        cls._fingerprint_directory = None
+        cls._fingerprint_stats = None
+
+    @classmethod
+    def _setColumnFilterDict(cls, url_path, dict = None):
+        if cls._column_filter_dict is None:
+            cls._column_filter_dict = url_path.get_default_dict().copy()
+        if dict is not None:
+            for key, value in dict.items():
+                if isinstance(key, ColumnSelector):
+                    if isinstance(value, bool):
+                        cls._column_filter_dict[key] = value
+                    else:
+                        raise TypeError(f"Expected bool, but received {type(value)}")
+                else:
+                    raise TypeError(f"Expected ColumnSelector enumeration member, but received {type(key)}")
+
+    # Yields (names, data) for every page, data holds one list of serialized values per column
+    @classmethod
+    def _getColumnData(cls, url_path, columnlist, pages=range(1, 1)):
+        if not isinstance(pages, range):
+            raise TypeError(f"Expected range for pages, but received {type(pages)}")
+        if pages.start < 1:
+            raise ValueError(f"Page range is restricted to [1, infinity), received range [{pages.start}, {pages.stop})")
+        # Pages the other tabs load while the current one is read are looked up in page_range
+        page_range = pages if len(pages) > 0 else range(pages.start, sys.maxsize)
+        if len(pages) == 0:
+            pages = itertools.count(start=pages.start)
+        # Pages fetched by the browser whose serialization may still be running, at most _pipeline_depth
+        # of them are held back before the oldest is waited for
+        pending = deque()
+        depth = cls._pipeline_depth if cls._serializer_executor is not None else 0
+        try:
+            for page in pages:
+                cls._metrics.startPage(page)
+                if cls._tabs > 1:
+                    cls._tab_queue = cls._getUpcomingUrls(page_range, page)
+                fetched = cls._fetchPageData(page, columnlist, url_path)
+                pending.append((page, fetched))
+                if fetched[0] is None:
+                    break
+                while len(pending) > depth:
+                    yield from cls._yieldPageData(*pending.popleft(), columnlist, url_path)
+            while len(pending) > 0:
+                page_name_list = yield from cls._yieldPageData(*pending.popleft(), columnlist, url_path)
+                if page_name_list is None:
+                    return
+        except BaseException:
+            # Pages fetched ahead of a failure are still journaled so that a resumed scrape skips them
+            cls._finishPendingPages(pending)
+            raise
+
+    @classmethod
+    def _finishPendingPages(cls, pending):
+        while len(pending) > 0:
+            page, fetched = pending.popleft()
+            try:
+                cls._finishPageData(page, *fetched)
+            except Exception as e:
+                print(f"Page {page} could not be finished: {e}", file=sys.stderr)
+
+    # URLs of the pages after page for the tabs other than the current one, pages of the journal are never loaded
+    @classmethod
+    def _getUpcomingUrls(cls, page_range, page):
+        upcoming = []
+        for next_page in page_range[page_range.index(page) + 1:]:
+            if len(upcoming) == cls._tabs - 1:
+                break
+            if cls._journal_records is not None:
+                if cls._journal_end is not None and next_page >= cls._journal_end:
+                    break
+                if next_page in cls._journal_records:
+                    continue
+            upcoming.append(cls._getPageUrl(next_page))
+        return upcoming
+
+    @classmethod
+    def _getPageUrl(cls, page):
+        return cls._url + "?page=" + str(page)
+
+    @classmethod
+    def _yieldPageData(cls, page, fetched, columnlist, url_path):
+        page_name_list, tmp_outer_list = cls._finishPageData(page, *fetched)
+        if page_name_list is None:
+            cls._metrics.endPage(page)
+            return None
+        yield (page_name_list, tmp_outer_list)
+        # Resumed once the consumer has written the page
+        cls._metrics.endPage(page, len(page_name_list))
+        return page_name_list
+
+    # Append-only record of every finished page, kept next to the target CSV until it is written
+    @classmethod
+    def _openJournal(cls, filename, columnlist):
+        cls._journal_filename = f"{filename}.journal"
+        cls._journal_records = {}
+        cls._journal_end = None
+        scrape = {"url": cls._url, "columns": [column.value for column in columnlist]}
+        created = time.time()
+        directory = os.path.dirname(cls._journal_filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Rewrite only the valid records so appends never follow a torn line,
+        # only the offset of each record is kept in memory
+        tmp_filename = f"{cls._journal_filename}.tmp"
+        with ExitStack() as stack:
+            journal = None
+            if os.path.exists(cls._journal_filename):
+                journal = stack.enter_context(open(cls._journal_filename, 'r'))
+                try:
+                    header = json.loads(journal.readline())
+                except json.JSONDecodeError:
+                    header = {}
+                journal_created = header.pop("created", None) if isinstance(header, dict) else None
+                if journal_created is None or header != scrape:
+                    print(f"Discarding {cls._journal_filename}, it was written for a different scrape", file=sys.stderr)
+                    journal = None
+                # Resuming is for restarting after a failure, not for carrying rows over to the next refresh
+                elif cls._journal_max_age is not None and created - journal_created > cls._journal_max_age:
+                    print(f"Discarding {cls._journal_filename}, it is older than {cls._journal_max_age}s", file=sys.stderr)
+                    journal = None
+                else:
+                    # The age is counted from the first attempt however often the scrape is resumed
+                    created = journal_created
+            tmp = stack.enter_context(open(tmp_filename, 'w'))
+            tmp.write(json.dumps({**scrape, "created": created}) + "\n")
+            if journal is not None:
+                for line in journal:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash can leave the last record partially written
+                        break
+                    if not line.endswith("\n"):
+                        break
+                    if "end" in record:
+                        cls._journal_end = record["end"]
+                    else:
+                        cls._journal_records[record["page"]] = tmp.tell()
+                    tmp.write(line)
+                print(f"Resuming from {cls._journal_filename} with {len(cls._journal_records)} finished pages", file=sys.stderr)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_filename, cls._journal_filename)
+        cls._journal = open(cls._journal_filename, 'a+')
+
+    @classmethod
+    def _readJournal(cls, page):
+        cls._metrics.count("journal_pages")
+        cls._journal.seek(cls._journal_records[page])
+        record = json.loads(cls._journal.readline())
+        return (record["names"], record["values"])
+
+    @classmethod
+    def _appendJournal(cls, record):
+        if cls._journal is not None:
+            cls._journal.write(json.dumps(record) + "\n")
+            cls._journal.flush()
+            os.fsync(cls._journal.fileno())
+
+    @classmethod
+    def _closeJournal(cls, remove=False):
+        if cls._journal is not None:
+            cls._journal.close()
+            if remove:
+                os.remove(cls._journal_filename)
+        cls._journal = None
+        cls._journal_end = None
+        cls._journal_filename = None
+        cls._journal_records = None
+
+    # Returns (names, data) for a page from the journal, the HTTP backend or the browser
+    @classmethod
+    def _getPageData(cls, page, columnlist, url_path):
+        return cls._finishPageData(page, *cls._fetchPageData(page, columnlist, url_path))
+
+    # Returns (names, data, unrecorded) where data may still be a Future of the serialized columns
+    # and unrecorded tells whether the page still has to be journaled
+    @classmethod
+    def _fetchPageData(cls, page, columnlist, url_path):
+        if cls._journal_records is not None:
+            if page in cls._journal_records:
+                return (*cls._readJournal(page), False)
+            if cls._journal_end is not None and page >= cls._journal_end:
+                return (None, None, False)
+        url = cls._getPageUrl(page)
+        page_data = None
+        if cls._backend is Backend.HTTP:
+            page_data = cls._getHttpPageData(page, url, columnlist, url_path)
+        elif cls._backend is Backend.XHR:
+            page_data = cls._getXhrPageData(page, url, columnlist, url_path)
+        if page_data is None:
+            page_data = cls._getBrowserPageData(page, url, columnlist, url_path)
+        return (*page_data, True)
+
+    # Waits for the serialized columns of a fetched page and records it, always in page order
+    @classmethod
+    def _finishPageData(cls, page, page_name_list, data, unrecorded):
+        if isinstance(data, Future):
+            data = data.result()
+        if unrecorded:
+            if page_name_list is None:
+                cls._appendJournal({"end": page})
+            else:
+                cls._appendJournal({"page": page, "names": page_name_list, "values": data})
+        if page_name_list is not None:
+            cls._recordFingerprint(page, page_name_list, data)
+        return (page_name_list, data)
+
+    # Shoe names listed on a page, or None past the last page of the catalog; no column is touched
+    @classmethod
+    def _getPageNames(cls, url, url_path):
+        if cls._backend is Backend.HTTP:
+            response = cls._fetchPage(url)
+            if response is not None:
+                status, html = response
+                if status >= 400:
+                    return None
+                with cls._metrics.phase("parsing"):
+                    parser = cls._parseCatalogPage(html)
+                if len(parser.names) > 0:
+                    return parser.names
+        cls._loadBrowserPage(url, url_path)
+        if cls._getPageStatus() >= 400:
+            return None
+        return cls._getShoeNames()
+
+    # Walks the men's and women's catalogs of url_path reading names only, so a merged scrape
+    # extracts columns from the unisex catalog alone
+    @classmethod
+    def _getGenderMembership(cls, url_path):
+        membership = {}
+        for gender in (Gender.MEN, Gender.WOMEN):
+            url = f"https://{cls._domain}{url_path.get_url_path(gender=gender)}"
+            for page in itertools.count(start=1):
+                page_name_list = cls._getPageNames(f"{url}?page={page}", url_path)
+                if page_name_list is None:
+                    break
+                for name in page_name_list:
+                    membership.setdefault(name, set()).add(gender)
+            print(f"Found {len([genders for genders in membership.values() if gender in genders])} shoes in the {gender.name.lower()}'s catalog of {url_path.name}", file=sys.stderr)
+        return membership
+
+    # Rows of a page, with the gender membership appended in a merged gender scrape
+    @classmethod
+    def _getRows(cls, page_name_list, tmp_outer_list):
+        rows = zip(page_name_list, *tmp_outer_list)
+        if cls._gender_membership is None:
+            return rows
+        serializer = Gender.get_column_lambda()
+        return (row + (serializer(cls._gender_membership.get(row[0], set())),) for row in rows)
+
+    # Model generated for url_path by app1.models
+    @staticmethod
+    def _getModel(url_path):
+        return apps.get_model("app1", url_path.name.title())
+
+    # Loads one page into the model table of url_path: the rows are COPYed into a staging table
+    # and upserted on shoe_name from there, all in one transaction
+    @classmethod
+    def _upsertPage(cls, url_path, columnlist, page_name_list, tmp_outer_list):
+        model = cls._getModel(url_path)
+        quote = connection.ops.quote_name
+        table = quote(model._meta.db_table)
+        stage = quote(f"{model._meta.db_table}_stage")
+        key = quote(model._meta.pk.column)
+        columns = [key] + [quote(model._meta.get_field(url_path.get_column_name(column, attribute=True)).column) for column in columnlist]
+        if cls._gender_membership is not None:
+            columns.append(quote(model._meta.get_field(Gender.get_column_name(attribute=True)).column))
+        column_sql = ", ".join(columns)
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns[1:])
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"CREATE TEMPORARY TABLE {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+            with cursor.copy(f"COPY {stage} ({column_sql}) FROM STDIN") as copy:
+                for row in cls._getRows(page_name_list, tmp_outer_list):
+                    copy.write_row(row)
+            # A name listed twice on a page would make the upsert touch the same row twice
+            cursor.execute(f"INSERT INTO {table} ({column_sql}) SELECT DISTINCT ON ({key}) {column_sql} FROM {stage} ORDER BY {key} ON CONFLICT ({key}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING"))
+            # Inside an outer transaction ON COMMIT DROP only runs once that commits, after the next page
+            cursor.execute(f"DROP TABLE {stage}")
+
+    # Streams rows page by page into a sibling file of filename that always holds a valid prefix of the CSV
+    # (the target is only replaced once every page has been written) and, with database set, into the model table;
+    # with merge set only the scraped columns of an existing CSV are replaced once the scrape is complete
+    @classmethod
+    def _writePages(cls, filename, pages, url_path, columnlist, database=False, merge=False):
+        with ExitStack() as stack:
+            writer = None
+            merged_rows = None
+            if filename is not None:
+                fieldnames = ["SHOE_NAME"] + [url_path.get_column_name(column, display_units=True) for column in columnlist]
+                if cls._gender_membership is not None:
+                    fieldnames.append(Gender.get_column_name())
+                directory = os.path.dirname(filename)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                partial_filename = f"{filename}.partial"
+                if merge:
+                    merged_rows = {}
+                else:
+                    f = stack.enter_context(open(partial_filename, 'w', newline=''))
+                    writer = csv.writer(f, lineterminator="\n")
+                    writer.writerow(fieldnames)
+            if pages is None:
+                page_data = cls._getColumnData(url_path=url_path, columnlist=columnlist)
+            else:
+                page_data = cls._getColumnData(url_path=url_path, columnlist=columnlist, pages=pages)
+            for page_name_list, tmp_outer_list in page_data:
+                for inner_list in tmp_outer_list:
+                    if len(inner_list) != len(page_name_list):
+                        raise ValueError(f"Incongruent Lists: names list has length {len(page_name_list)}, but a list in the data list has length {len(inner_list)}")
+                if writer is not None:
+                    with cls._metrics.phase("csv"):
+                        writer.writerows(cls._getRows(page_name_list, tmp_outer_list))
+                        f.flush()
+                if merged_rows is not None:
+                    for row in cls._getRows(page_name_list, tmp_outer_list):
+                        merged_rows[row[0]] = row[1:]
+                if database:
+                    with cls._metrics.phase("database"):
+                        cls._upsertPage(url_path, columnlist, page_name_list, tmp_outer_list)
+        if merged_rows is not None:
+            with cls._metrics.phase("csv"):
+                cls._mergeCSV(filename, partial_filename, fieldnames, merged_rows)
+        if filename is not None:
+            os.replace(partial_filename, filename)
+
+    # Replaces the fieldnames columns of every scraped shoe in an existing CSV, adding missing columns
+    # and shoes; every other cell is kept as it is
+    @staticmethod
+    def _mergeCSV(filename, partial_filename, fieldnames, merged_rows):
+        header = ["SHOE_NAME"]
+        rows = []
+        if os.path.exists(filename):
+            with open(filename, 'r', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, header)
+                rows = list(reader)
+        for field in fieldnames[1:]:
+            if field not in header:
+                header.append(field)
+        indices = [header.index(field) for field in fieldnames[1:]]
+        names = set()
+        for row in rows:
+            row.extend('' for _ in range(len(header) - len(row)))
+            names.add(row[0])
+        rows.extend([name] + ['' for _ in header[1:]] for name in merged_rows if name not in names)
+        with open(partial_filename, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(header)
+            for row in rows:
+                if row[0] in merged_rows:
+                    for index, value in zip(indices, merged_rows[row[0]]):
+                        row[index] = '' if value is None else value
+                writer.writerow(row)
+
+    # Waits only as long as it takes for the table to re-render after clicks that change it,
+    # all waiting is accounted for in _wait_time
+    @classmethod
+    def _scroll_and_click(cls, selector, rerender=False):
+        start = time.perf_counter()
+        with cls._metrics.phase("clicks"):
+            try:
+                # Change the selector type if necessary, e.g., By.ID, By.NAME, By.XPATH, etc.
+                element = WebDriverWait(driver=cls._browser, timeout=cls._timeout, poll_frequency=0.05).until(EC.visibility_of_element_located(selector))
+                # Scroll the element into view
+                cls._browser.execute_script(cls._scroll_script, element, rerender)
+                # Wait for the element to be clickable, and then click it
+                WebDriverWait(driver=cls._browser, timeout=cls._timeout, poll_frequency=0.05).until(EC.element_to_be_clickable(selector)).click()
+            except TimeoutException:
+                cls._metrics.count("click_timeouts")
+                raise
+            cls._metrics.count("clicks")
+            if rerender:
+                cls._waitForRerender()
+            # Optional fixed delay after clicking
+            if cls._sleep > 0:
+                time.sleep(cls._sleep)
+        cls._wait_time += time.perf_counter() - start
+
+    # The timeout follows the observed re-render latency, and is widened again after a miss
+    @classmethod
+    def _waitForRerender(cls):
+        if cls._rerender_latency is None:
+            timeout = cls._timeout
+        else:
+            timeout = min(cls._timeout, max(0.05, 3 * cls._rerender_latency))
+        start = time.perf_counter()
+        rerendered = cls._browser.execute_async_script(cls._rerender_script, int(timeout * 1000))
+        latency = time.perf_counter() - start
+        if rerendered:
+            if cls._rerender_latency is None:
+                cls._rerender_latency = latency
+            else:
+                cls._rerender_latency = 0.8 * cls._rerender_latency + 0.2 * latency
+        else:
+            cls._rerender_timeouts += 1
+            cls._metrics.count("rerender_timeouts")
+            cls._rerender_latency = timeout
+            print(f"Timeout exceeded after {timeout:.2f}s waiting for the table to re-render", file=sys.stderr)
+
+    # Change view to table
+    @classmethod
+    def _getSlimListView(cls):
+        cls._ensureBrowser()
+        if cls._tab_scheduler is not None:
+            cls._openLaneTab()
+        with cls._metrics.phase("navigation"):
+            cls._browser.get(cls._url)
+        cookie = cls._browser.get_cookie("list_type")
+        if cookie is None or cookie["value"] != "slim" or cookie["expiry"] < time.time():
+            cls._scroll_and_click(selector=(By.CSS_SELECTOR, "svg.slim-view-icon.catalog__list-tab-icon"), rerender=True)
+        cls._slim_list_view = True
+
+    @classmethod
+    def _setTimeout(cls, timeout):
+        if not isinstance(timeout, (int, float)):
+            raise TypeError(f"Expected integer or floating-point for timeout, but received {type(timeout)}")
+        if timeout < 0:
+            raise ValueError(f"Expected non-negative value for timeout, but received {timeout}")
+        cls._timeout = timeout
+
+    @classmethod
+    def _setSleep(cls, sleep):
+        if not isinstance(sleep, (int, float)):
+            raise TypeError(f"Expected integer or floating-point for sleep, but received {type(sleep)}")
+        if sleep < 0:
+            raise ValueError(f"Expected non-negative value for sleep, but received {sleep}")
+        cls._sleep = sleep
+
+    @classmethod
+    def _setBackend(cls, backend):
+        if not isinstance(backend, Backend):
+            raise TypeError("backend must be an enumeration member of type Backend")
+        cls._backend = backend
+        # The performance log can only be switched on or off when the browser starts, only the XHR backend
+        # drains it so the browser is restarted without it for the other backends
+        performance_log = backend is Backend.XHR
+        if performance_log != cls._performance_log:
+            cls._performance_log = performance_log
+            if cls._browser is not None:
+                cls._recycleBrowser()
+
+    @classmethod
+    def _setPoolSize(cls, pool_connections, pool_maxsize):
+        for name, value in (("pool_connections", pool_connections), ("pool_maxsize", pool_maxsize)):
+            if value is None:
+                continue
+            if not isinstance(value, int):
+                raise TypeError(f"Expected integer for {name}, but received {type(value)}")
+            if value < 1:
+                raise ValueError(f"Expected positive value for {name}, but received {value}")
+        changed = False
+        if pool_connections is not None and pool_connections != cls._pool_connections:
+            cls._pool_connections = pool_connections
+            changed = True
+        if pool_maxsize is not None and pool_maxsize != cls._pool_maxsize:
+            cls._pool_maxsize = pool_maxsize
+            changed = True
+        if changed and cls._session is not None:
+            cls._mountAdapter(cls._session)
+
+    # Tabs of the one browser the pages are spread over, each loads its next page while another one is read
+    @classmethod
+    def _setTabs(cls, tabs):
+        if not isinstance(tabs, int):
+            raise TypeError(f"Expected integer for tabs, but received {type(tabs)}")
+        if tabs < 1:
+            raise ValueError(f"Expected positive value for tabs, but received {tabs}")
+        # The other backends only load a page in the browser when they cannot read it on their own
+        if tabs > 1 and cls._backend is not Backend.SELENIUM:
+            raise ValueError(f"tabs is only supported by Backend.SELENIUM, but received {cls._backend}")
+        # A lane already owns a tab of its own, the other lanes load theirs in the background
+        if cls._tab_scheduler is not None and (tabs > 1 or cls._backend is not Backend.SELENIUM):
+            raise ValueError(f"Tab jobs only support Backend.SELENIUM with one tab each, but received {cls._backend} with {tabs} tabs")
+        cls._tabs = tabs
+
+    @classmethod
+    def _setSinglePass(cls, single_pass):
+        if not isinstance(single_pass, bool):
+            raise TypeError(f"Expected bool for single_pass, but received {type(single_pass)}")
+        cls._single_pass = single_pass
+
+    # Columns to scrape in the order given, every column stored in the model table if columnlist is None
+    @staticmethod
+    def _getColumnList(url_path, columnlist, database):
+        if columnlist is None:
+            return url_path.get_django_available_columns()
+        if not isinstance(columnlist, (list, tuple)):
+            raise TypeError(f"Expected list of ColumnSelector enumeration members for columnlist, but received {type(columnlist)}")
+        if len(columnlist) == 0:
+            raise ValueError("columnlist must contain at least one column")
+        available = url_path.get_available_columns()
+        for column in columnlist:
+            if not isinstance(column, ColumnSelector):
+                raise TypeError(f"Expected ColumnSelector enumeration member, but received {type(column)}")
+            if column not in available:
+                raise ValueError(f"{column} is not available for {url_path}")
+            if database and url_path.get_column_model(column) is None:
+                raise ValueError(f"{column} has no field in the {url_path.name.title()} model and cannot be written to the database")
+        return list(dict.fromkeys(columnlist))
+
+    @classmethod
+    def _setUrl(cls, url_path, gender):
+        if not isinstance(url_path, Url_Paths):
+            raise TypeError("url_path must be an enumeration member of type Url_Paths")
+        if not isinstance(gender, Gender):
+            raise TypeError("url_path must be an enumeration member of type Gender")
+        cls._url += url_path.get_url_path(gender=gender)
+
+    # PUBLIC INTERFACE METHOD
+    @classmethod
+    def scrape(cls, filename, url_path=Url_Paths.RUNNING_SHOES, gender=Gender.NONE, pages=None, sleep=None, timeout=None, single_pass=False, backend=Backend.SELENIUM, pool_connections=None, pool_maxsize=None, checkpoint=True, cache_dir=None, report=None, database=False, merge_genders=False, snapshot=None, pipeline=False, columnlist=None, merge=False, tabs=1, page_count=None):
+        if page_count is not None:
+            if not isinstance(page_count, int):
+                raise TypeError(f"Expected integer for page_count, but received {type(page_count)}")
+            if page_count < 0:
+                raise ValueError(f"Expected non-negative value for page_count, but received {page_count}")
+        if not isinstance(merge, bool):
+            raise TypeError(f"Expected bool for merge, but received {type(merge)}")
+        if not isinstance(pipeline, bool):
+            raise TypeError(f"Expected bool for pipeline, but received {type(pipeline)}")
+        if snapshot is not None and not isinstance(snapshot, ScrapeSnapshot):
+            raise TypeError(f"Expected ScrapeSnapshot for snapshot, but received {type(snapshot)}")
+        if not isinstance(merge_genders, bool):
+            raise TypeError(f"Expected bool for merge_genders, but received {type(merge_genders)}")
+        if merge_genders and gender is not Gender.NONE:
+            raise ValueError(f"merge_genders scrapes the unisex catalog and tags gender membership, but received {gender}")
+        if not isinstance(database, bool):
+            raise TypeError(f"Expected bool for database, but received {type(database)}")
+        # Without a CSV the rows only go to the model table
+        if filename is None and not database:
+            raise TypeError("filename must be a string unless database is set")
+        # The model table is upserted anyway, merge only applies to an existing CSV
+        if merge and filename is None:
+            raise ValueError("merge replaces columns of an existing CSV and requires a filename")
+        if filename is not None and not isinstance(filename, str):
+            raise TypeError("filename must be a string")
+        if filename is not None and not re.match(r'^(/[\w\s./-]+)*\/?[\w]+\.(csv)$', filename):
+            raise ValueError("filename must be a full or relative path to a csv file (existing csv files will be overwritten)")
+        if not isinstance(checkpoint, bool):
+            raise TypeError(f"Expected bool for checkpoint, but received {type(checkpoint)}")
+        if report is not None and not isinstance(report, str):
+            raise TypeError(f"Expected string for report, but received {type(report)}")
+        try:
+            cls._metrics = _ScrapeMetrics(url_path, gender, pages)
+            cls._setUrl(url_path=url_path, gender=gender)
+            columnlist = cls._getColumnList(url_path, columnlist, database)
+            if sleep is not None:
+                cls._setSleep(sleep)
+            if timeout is not None:
+                cls._setTimeout(timeout)
+            cls._setSinglePass(single_pass)
+            cls._setBackend(backend)
+            cls._setTabs(tabs)
+            cls._setPoolSize(pool_connections, pool_maxsize)
+            cls._snapshot = snapshot
+            if pipeline:
+                cls._serializer_executor = ThreadPoolExecutor(max_workers=cls._pipeline_workers, thread_name_prefix="serializer")
+            if checkpoint and filename is not None:
+                cls._openJournal(filename, columnlist)
+            if cache_dir is not None:
+                cls._openFingerprints(cache_dir, url_path, gender, columnlist)
+            # The HTTP backend only needs the browser for pages it cannot read on its own
+            if cls._backend is Backend.SELENIUM and not cls._isReplaying():
+                cls._getSlimListView()
+            if merge_genders:
+                cls._gender_membership = cls._getGenderMembership(url_path)
+            # Without a closed page range the ETA needs the number of pages in the catalog
+            if cls._metrics.total_pages is None:
+                if page_count is None and not cls._isReplaying():
+                    page_count = cls._countPagesOverHttp()
+                start = 1 if pages is None else pages.start
+                if page_count is not None and page_count >= start:
+                    cls._metrics.total_pages = page_count - start + 1
+            cls._writePages(filename=filename, pages=pages, url_path=url_path, columnlist=columnlist, database=database, merge=merge)
+            cls._closeJournal(remove=True)
+            cls._closeFingerprints(report=True)
+            print(f"Waited {cls._wait_time:.2f}s on clicks ({cls._rerender_timeouts} re-render timeouts)", file=sys.stderr)
+            print(cls._metrics.summary(), file=sys.stderr)
+            if cls._snapshot is not None:
+                if cls._snapshot.mode is SnapshotMode.RECORD:
+                    cls._snapshot.evict()
+                print(f"Snapshot {cls._snapshot.directory}: {cls._snapshot.reads} reads, {cls._snapshot.writes} writes", file=sys.stderr)
+            if report is not None:
+                cls._metrics.write(report)
+        finally:
+            if cls._serializer_executor is not None:
+                cls._serializer_executor.shutdown(cancel_futures=True)
+                cls._serializer_executor = None
+            # Keeps the journal of a failed scrape so the next call resumes from it
+            cls._closeJournal()
+            cls._closeFingerprints()
+            cls._closeTabs()
+            cls._resetClassVariables()
+
+    def __init__(self):
+        pass
+
+    # Set up Chromium options
+    @classmethod
+    def _getChromiumOptions(cls):
+        chromium_options = Options()
+# FIXME: Ensure the following is uncommented, do not commit or approve any PR with the next line commented out
+        chromium_options.add_argument("--headless")
+        chromium_options.add_argument("--no-sandbox")
+        # /dev/shm is generally a tmpfs directory
+        chromium_options.add_argument("--disable-dev-shm-usage")
+        # Keep the renderer small, nothing but the catalog table is ever read
+        chromium_options.add_argument("--renderer-process-limit=1")
+        chromium_options.add_argument("--disable-extensions")
+        chromium_options.add_argument("--disable-background-networking")
+        chromium_options.add_argument("--disable-component-update")
+        chromium_options.add_argument("--mute-audio")
+        # Tabs loading pages in the background are not throttled
+        chromium_options.add_argument("--disable-background-timer-throttling")
+        chromium_options.add_argument("--disable-renderer-backgrounding")
+        chromium_options.add_argument("--disable-backgrounding-occluded-windows")
+        if cls._js_heap_size is not None:
+            chromium_options.add_argument(f"--js-flags=--max-old-space-size={cls._js_heap_size}")
+        if cls._performance_log:
+            # Network events of every request, read back by the XHR backend
+            chromium_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if BlockedResource.IMAGES in cls._blocked_resources:
+            chromium_options.add_argument("--blink-settings=imagesEnabled=false")
+            chromium_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        # Create a temporary directory for the user data, removed again by _quitBrowser
+        cls._profile_directory = tempfile.mkdtemp(prefix="shoe-expert-chromium-")
+        # Add the user data directory argument
+        chromium_options.add_argument(f"--user-data-dir={cls._profile_directory}")
+        chromium_options.binary_location = cls._chromium_location
+        return chromium_options
+
+    # Set up the browser
+    @classmethod
+    def _initBrowser(cls):
+        service = Service(cls._driver_path)
+        browser = webdriver.Chrome(service=service, options=cls._getChromiumOptions())
+        browser.delete_all_cookies()
+        patterns = [pattern for resource in BlockedResource if resource in cls._blocked_resources for pattern in resource.get_url_patterns()]
+        if len(patterns) > 0 or cls._performance_log:
+            browser.execute_cdp_cmd("Network.enable", {})
+        if len(patterns) > 0:
+            browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        execute = browser.execute
+        # Every WebDriver command, WebElement ones included, is sent through execute
+        def countedExecute(driver_command, params=None):
+            cls._metrics.count("webdriver_calls")
+            return execute(driver_command, params)
+        browser.execute = countedExecute
+        cls._browser = browser
+        cls._browser_pages = 0
+        cls._browser_peak_rss = 0
+        cls._browser_sessions += 1
+        # Registered once however often the browser is restarted
+        atexit.unregister(cls._cleanup)
+        atexit.register(cls._cleanup)
+
+    @classmethod
+    def _quitBrowser(cls):
+        if cls._browser is not None:
+            if cls._browser_pages > 0:
+                # The pages are measured before they load, so the last one is only measured here
+                cls._browser_peak_rss = max(cls._browser_peak_rss, cls.getBrowserMemory())
+                print(f"Browser session {cls._browser_sessions}: {cls._browser_pages} pages, peak RSS {cls._browser_peak_rss / 2**20:.0f} MiB", file=sys.stderr)
+            try:
+                cls._browser.quit()
+            finally:
+                cls._browser = None
+                cls._tab_current = None
+                cls._tab_handles = None
+                cls._tab_urls = None
+        if cls._profile_directory is not None:
+            shutil.rmtree(cls._profile_directory, ignore_errors=True)
+            cls._profile_directory = None
+
+    # Replaces the browser with a fresh one carrying over the cookies, the slim view is restored
+    # from the list_type cookie on the next page load
+    @classmethod
+    def _recycleBrowser(cls):
+        cookies = []
+        try:
+            cookies = cls._browser.get_cookies()
+        except WebDriverException as e:
+            print(f"Could not read cookies before restarting the browser: {e}", file=sys.stderr)
+        cls._metrics.count("browser_restarts")
+        cls._quitBrowser()
+        cls._initBrowser()
+        params = []
+        for cookie in cookies:
+            param = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite") if key in cookie}
+            if "expiry" in cookie:
+                param["expires"] = cookie["expiry"]
+            params.append(param)
+        if len(params) > 0:
+            cls._browser.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        cls._slim_list_view = False
+
+    @classmethod
+    def _ensureBrowser(cls):
+        if cls._browser is None:
+            cls._initBrowser()
+
+    # Counts the page about to be loaded against the current browser session and restarts the
+    # browser once it has rendered _recycle_pages pages or grown past _max_browser_rss
+    @classmethod
+    def _checkBrowserSession(cls):
+        cls._ensureBrowser()
+        # Read once per page, it walks /proc for every process of the browser
+        rss = cls.getBrowserMemory()
+        cls._browser_peak_rss = max(cls._browser_peak_rss, rss)
+        if cls._recycle_pages is not None and cls._browser_pages >= cls._recycle_pages:
+            cls._recycleBrowser()
+        elif cls._max_browser_rss is not None and rss > cls._max_browser_rss * 2**20:
+            print(f"Browser RSS {rss / 2**20:.0f} MiB exceeds {cls._max_browser_rss} MiB, restarting", file=sys.stderr)
+            cls._recycleBrowser()
+        cls._browser_pages += 1
+
+    # Number of pages for which exists(page) holds, found by probing exponentially growing page numbers
+    # past the end and bisecting between the last page found and the first one missing
+    @staticmethod
+    def _countPages(exists):
+        if not exists(1):
+            return 0
+        low, high = 1, 2
+        while exists(high):
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if exists(middle):
+                low = middle
+            else:
+                high = middle
+        return low
+
+    # Number of pages of the catalog at cls._url read over HTTP alone, it never loads a page in the browser;
+    # None if a request fails or the catalog is not rendered server-side
+    @classmethod
+    def _countPagesOverHttp(cls):
+        def exists(page):
+            cls._metrics.count("http_requests")
+            response = cls._getSession().get(f"{cls._url}?page={page}", timeout=cls._http_timeout)
+            return response.status_code < 400 and len(cls._parseCatalogPage(response.text).names) > 0
+        try:
+            with cls._metrics.phase("page_count"):
+                page_count = cls._countPages(exists)
+        except requests.RequestException as e:
+            print(f"Could not count the pages of {cls._url}, no ETA is shown: {e}", file=sys.stderr)
+            return None
+        return page_count if page_count > 0 else None
+
+    # PUBLIC INTERFACE METHOD
+    # Number of pages in the catalog of url_path and gender
+    @classmethod
+    def getPageCount(cls, url_path=Url_Paths.RUNNING_SHOES, gender=Gender.NONE, backend=Backend.HTTP):
+        if not isinstance(url_path, Url_Paths):
+            raise TypeError("url_path must be an enumeration member of type Url_Paths")
+        if not isinstance(gender, Gender):
+            raise TypeError("gender must be an enumeration member of type Gender")
+        try:
+            # The browser fallback of _getPageNames opens the catalog of cls._url to switch to the slim view
+            cls._setUrl(url_path=url_path, gender=gender)
+            url = cls._url
+            cls._setBackend(backend)
+            return cls._countPages(lambda page: cls._getPageNames(f"{url}?page={page}", url_path) is not None)
+        finally:
+            cls._resetClassVariables()
+
+    # PUBLIC INTERFACE METHOD
+    # Restarts a running browser so the new profile takes effect
+    @classmethod
+    def configureBrowser(cls, blocked_resources=None, js_heap_size=None, recycle_pages=None, max_browser_rss=None):
+        if blocked_resources is not None:
+            blocked_resources = frozenset(blocked_resources)
+            for resource in blocked_resources:
+                if not isinstance(resource, BlockedResource):
+                    raise TypeError(f"Expected BlockedResource enumeration member, but received {type(resource)}")
+            cls._blocked_resources = blocked_resources
+        if js_heap_size is not None:
+            if not isinstance(js_heap_size, int):
+                raise TypeError(f"Expected integer for js_heap_size, but received {type(js_heap_size)}")
+            if js_heap_size < 64:
+                raise ValueError(f"Expected at least 64 (MB) for js_heap_size, but received {js_heap_size}")
+            cls._js_heap_size = js_heap_size
+        if recycle_pages is not None:
+            if not isinstance(recycle_pages, int):
+                raise TypeError(f"Expected integer for recycle_pages, but received {type(recycle_pages)}")
+            if recycle_pages < 1:
+                raise ValueError(f"Expected positive value for recycle_pages, but received {recycle_pages}")
+            cls._recycle_pages = recycle_pages
+        if max_browser_rss is not None:
+            if not isinstance(max_browser_rss, int):
+                raise TypeError(f"Expected integer for max_browser_rss, but received {type(max_browser_rss)}")
+            if max_browser_rss < 1:
+                raise ValueError(f"Expected positive value (MB) for max_browser_rss, but received {max_browser_rss}")
+            cls._max_browser_rss = max_browser_rss
+        if cls._browser is not None and (blocked_resources is not None or js_heap_size is not None):
+            cls._recycleBrowser()
+
+    # PUBLIC INTERFACE METHOD
+    # Resident memory in bytes of chromedriver and every process it spawned, 0 without a browser
+    @classmethod
+    def getBrowserMemory(cls):
+        if cls._browser is None:
+            return 0
+        children = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as stat:
+                    # The process name may contain spaces, the fields after it do not
+                    ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+        rss = 0
+        pending = [cls._browser.service.process.pid]
+        while len(pending) > 0:
+            pid = pending.pop()
+            pending.extend(children.get(pid, []))
+            try:
+                with open(f"/proc/{pid}/status") as status:
+                    for line in status:
+                        if line.startswith("VmRSS:"):
+                            rss += int(line.split()[1]) * 1024
+                            break
+            except OSError:
+                continue
+        return rss
+
+    def __new__(cls):
+        if platform.system() != "Linux":
+            raise RuntimeError("ScraperSingleton is only intended for Linux-based OSes")
+        cls._ensureBrowser()
+        return cls
+
+# Runs once in every worker process of a ScraperPool
+def _initScraperWorker():
+    # A browser inherited through fork belongs to the parent process
+    ScraperSingleton._browser = None
+    ScraperSingleton._profile_directory = None
+    # So are the pooled sockets of its HTTP session
+    ScraperSingleton._session = None
+    Finalize(ScraperSingleton, ScraperSingleton._cleanup, exitpriority=10)
+
+def _runScraperJob(filename, url_path, gender, pages, kwargs):
+    ScraperSingleton().scrape(filename=filename, url_path=url_path, gender=gender, pages=pages, **kwargs)
+    return filename
+
+# With tabs set the workers are tabs of the browser of this process instead of worker processes
+# with a browser each, the categories or page ranges still load in parallel at the memory of one browser
+class ScraperPool:
+    def __init__(self, workers=None, tabs=False):
+        if workers is None:
+            workers = os.cpu_count()
+        if not isinstance(workers, int):
+            raise TypeError(f"Expected integer for workers, but received {type(workers)}")
+        if workers < 1:
+            raise ValueError(f"Expected positive value for workers, but received {workers}")
+        if not isinstance(tabs, bool):
+            raise TypeError(f"Expected bool for tabs, but received {type(tabs)}")
+        self._workers = workers
+        self._tabs = tabs
+
+    @staticmethod
+    def getFilename(directory, url_path, gender=Gender.NONE):
+        if gender is Gender.NONE:
+            return os.path.join(directory, f"{url_path.name.title()}.csv")
+        return os.path.join(directory, f"{gender.name.title()}_{url_path.name.title()}.csv")
+
+    @staticmethod
+    def _validateJob(job):
+        if not isinstance(job, tuple) or len(job) != 3:
+            raise TypeError(f"Expected (Url_Paths, Gender, pages) tuple for job, but received {job}")
+        url_path, gender, pages = job
+        if not isinstance(url_path, Url_Paths):
+            raise TypeError("url_path must be an enumeration member of type Url_Paths")
+        if not isinstance(gender, Gender):
+            raise TypeError("gender must be an enumeration member of type Gender")
+        if pages is not None and not isinstance(pages, range):
+            raise TypeError(f"Expected range or None for pages, but received {type(pages)}")
+
+    # Runs every job on the pool with filenames[i] and kwargs_list[i], returns the filenames in job order.
+    # Results are kept by job index since the same job may be submitted more than once
+    def _runJobs(self, jobs, filenames, kwargs_list):
+        completed = {}
+        failed = {}
+        def finish(index, result, error):
+            job = jobs[index]
+            if error is None:
+                completed[index] = result
+                print(f"Finished {job[0].name} ({job[1].name}): {result}")
+            else:
+                failed[index] = error
+                print(f"Failed {job[0].name} ({job[1].name}): {error}", file=sys.stderr)
+        calls = [functools.partial(_runScraperJob, filename, url_path, gender, pages, kwargs) for (url_path, gender, pages), filename, kwargs in zip(jobs, filenames, kwargs_list)]
+        if self._tabs:
+            ScraperSingleton._runTabJobs(calls, self._workers, finish)
+        else:
+            # The forked workers must not share the browser, HTTP sockets or database connections of this process
+            ScraperSingleton._cleanup()
+            connections.close_all()
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=min(self._workers, len(jobs)) or 1, mp_context=context, initializer=_initScraperWorker) as executor:
+                futures = {executor.submit(call): index for index, call in enumerate(calls)}
+                for future in as_completed(futures):
+                    error = future.exception()
+                    finish(futures[future], None if error is not None else future.result(), error)
+        if len(failed) > 0:
+            raise RuntimeError(f"{len(failed)} of {len(jobs)} scrape jobs failed: {[(jobs[index][0].name, jobs[index][1].name) for index in sorted(failed)]}")
+        return [completed[index] for index in range(len(jobs))]
+
+    @staticmethod
+    def _getJobKwargs(kwargs, filename, report):
+        job_kwargs = dict(kwargs)
+        if report:
+            # One JSON report next to every CSV
+            job_kwargs["report"] = f"{os.path.splitext(filename)[0]}.json"
+        return job_kwargs
+
+    # PUBLIC INTERFACE METHOD
+    # Each worker process drives its own browser (with tabs, each worker its own tab of this process's browser), a CSV is written as soon as its job finishes, returns {job: filename}
+    def scrape(self, jobs, directory, report=False, **kwargs):
+        if not isinstance(report, bool):
+            raise TypeError(f"Expected bool for report, but received {type(report)}")
+        jobs = list(jobs)
+        categories = set()
+        for job in jobs:
+            self._validateJob(job)
+            # The CSV and journal of a job are named after its category and gender alone
+            if job[:2] in categories:
+                raise ValueError(f"{job[0]} ({job[1]}) is scraped by more than one job, they would write the same CSV")
+            categories.add(job[:2])
+        filenames = [self.getFilename(directory, url_path, gender) for url_path, gender, _ in jobs]
+        return dict(zip(jobs, self._runJobs(jobs, filenames, [self._getJobKwargs(kwargs, filename, report) for filename in filenames])))
+
+    # Splits pages 1 to page_count into at most shards contiguous ranges, the last one is left open
+    # so that pages added to the catalog since it was counted are still scraped
+    @staticmethod
+    def _getShards(page_count, shards):
+        shards = max(1, min(shards, page_count))
+        size, extra = divmod(page_count, shards)
+        ranges = []
+        start = 1
+        for shard in range(shards):
+            stop = start + size + (1 if shard < extra else 0)
+            ranges.append(range(start, stop))
+            start = stop
+        ranges[-1] = range(ranges[-1].start, ranges[-1].start)
+        return ranges
+
+    # Concatenates the rows of every part in order below the header they share
+    @staticmethod
+    def _mergeParts(part_filenames, filename):
+        header = None
+        partial_filename = f"{filename}.partial"
+        with open(partial_filename, 'w', newline='') as f:
+            for part_filename in part_filenames:
+                with open(part_filename, 'r', newline='') as part:
+                    part_header = part.readline()
+                    if header is None:
+                        header = part_header
+                        f.write(header)
+                    elif part_header != header:
+                        raise ValueError(f"{part_filename} does not share the header of {part_filenames[0]}")
+                    shutil.copyfileobj(part, f)
+        os.replace(partial_filename, filename)
+
+    # PUBLIC INTERFACE METHOD
+    # Counts the pages of one catalog, scrapes contiguous page ranges of it on the workers and merges
+    # the parts in page order into filename, the same CSV a sequential scrape writes
+    def scrapeCategory(self, url_path, filename, gender=Gender.NONE, report=False, **kwargs):
+        self._validateJob((url_path, gender, None))
+        if not isinstance(report, bool):
+            raise TypeError(f"Expected bool for report, but received {type(report)}")
+        if not isinstance(filename, str):
+            raise TypeError("filename must be a string")
+        # Every shard writes a fresh part, there is no existing CSV for it to merge into
+        if kwargs.get("merge", False):
+            raise ValueError("merge is not supported by scrapeCategory, scrape the category's columnlist with ScraperSingleton.scrape instead")
+        filename = os.path.abspath(filename)
+        page_count = ScraperSingleton.getPageCount(url_path=url_path, gender=gender)
+        print(f"{url_path.name} ({gender.name}) has {page_count} pages")
+        # Fixed location so that the journals of a failed run are picked up again
+        shard_directory = f"{os.path.splitext(filename)[0]}.shards"
+        jobs = [(url_path, gender, pages) for pages in self._getShards(page_count, self._workers)]
+        part_filenames = [os.path.join(shard_directory, f"part_{shard + 1}.csv") for shard in range(len(jobs))]
+        # The open last shard would count the catalog again for its ETA
+        job_kwargs = dict(kwargs, page_count=page_count)
+        self._runJobs(jobs, part_filenames, [self._getJobKwargs(job_kwargs, part_filename, report) for part_filename in part_filenames])
+        self._mergeParts(part_filenames, filename)
+        shutil.rmtree(shard_directory, ignore_errors=True)
+        return filename
@@ -1,3 +1,4 @@
+from aggregate import Gender
 from aggregate import Url_Paths
 from django.contrib import admin
 from django.contrib.postgres.fields import ArrayField
@@ -43,6 +44,8 @@ def create_model_resource(url_path):
         attr_name = url_path.get_column_name(col, attribute = True)
         display_name = url_path.get_column_name(col)
         attrs[attr_name] = Field(attribute=attr_name, column_name=display_name, widget=get_widget_for_field(url_path.get_column_model(col)))
+    attr_name = Gender.get_column_name(attribute = True)
+    attrs[attr_name] = Field(attribute=attr_name, column_name=Gender.get_column_name(), widget=get_widget_for_field(Gender.get_column_model()))
     resource_name = url_path.name.capitalize() + '_resource'
     type_name = url_path.name.title() + '_Resource'
     globals()[resource_name] = type(type_name, (resources.ModelResource,), attrs)
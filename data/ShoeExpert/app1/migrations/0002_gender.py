@@ -0,0 +1,99 @@
+# Generated by Django 4.2.1 on 2026-10-18 09:42
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app1', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='approach_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='basketball_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='climbing_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='crossfit_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='cycling_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='football_cleats',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='golf_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='hiking_boots',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='hiking_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='running_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='sneakers',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='soccer_cleats',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='tennis_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='track_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='trail_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='training_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='walking_shoes',
+            name='gender',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(choices=[('Men', 'Men'), ('Women', 'Women')], max_length=5), blank=True, null=True, size=None),
+        ),
+    ]
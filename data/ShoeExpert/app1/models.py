@@ -1,3 +1,4 @@
+from aggregate import Gender
 from aggregate import Url_Paths
 from django.db import models
 
@@ -6,11 +7,14 @@ from django.db import models
 def create_shoe_model(url_path: Url_Paths):
     attrs = {
         '__module__': __name__,
-        "shoe_name": models.CharField(max_length=128, primary_key=True),
         "__str__": lambda self: self.shoe_name
     }
     for col in url_path.get_django_available_columns():
         attrs[url_path.get_column_name(col, attribute = True)] = url_path.get_column_model(col)
+    # Declared after the columns, which are only built on first use, so fields keep their order: columns, shoe_name, gender
+    attrs["shoe_name"] = models.CharField(max_length=128, primary_key=True)
+    # Only filled in by merged gender scrapes
+    attrs[Gender.get_column_name(attribute = True)] = Gender.get_column_model()
     globals()[url_path.name.capitalize()] = type(url_path.name.title(), (models.Model,), attrs)
 
 for url_path in Url_Paths:
@@ -2,7 +2,7 @@ import csv
 import random
 import string
 from decimal import Decimal
-from aggregate import Url_Paths
+from aggregate import ColumnSelector, Gender, ScraperSingleton, Url_Paths
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
@@ -142,3 +142,38 @@ def create_shoe_model_test(url_path: Url_Paths):
 
 for url_path in Url_Paths:
   create_shoe_model_test(url_path)
+
+class Upsert_Page_Test(TestCase):
+  def setUp(self):
+    self.url_path = Url_Paths.RUNNING_SHOES
+    self.model = ScraperSingleton._getModel(self.url_path)
+
+  def get_value(self, shoe_name: str, column: ColumnSelector):
+    return getattr(self.model.objects.get(shoe_name=shoe_name), self.url_path.get_column_name(column, attribute = True))
+
+  def test_copy_page(self):
+    columnlist = [ColumnSelector.BRAND, ColumnSelector.WEIGHT, ColumnSelector.PRONATION]
+    ScraperSingleton._upsertPage(self.url_path, columnlist, ["On Cloud", "Hoka Clifton 8"], [["On", "Hoka"], [8.1, None], ['{Neutral}', '{Overpronation, Severe Overpronation}']])
+    self.assertEqual(self.model.objects.count(), 2)
+    self.assertEqual(self.get_value("On Cloud", ColumnSelector.WEIGHT), Decimal("8.1"))
+    self.assertIsNone(self.get_value("Hoka Clifton 8", ColumnSelector.WEIGHT))
+    self.assertEqual(self.get_value("Hoka Clifton 8", ColumnSelector.PRONATION), ['Overpronation', 'Severe Overpronation'])
+    self.assertIsNone(self.model.objects.get(shoe_name="On Cloud").gender)
+
+  def test_name_listed_twice(self):
+    ScraperSingleton._upsertPage(self.url_path, [ColumnSelector.BRAND], ["On Cloud", "On Cloud"], [["On", "On"]])
+    self.assertEqual(self.model.objects.count(), 1)
+
+  def test_update_column_subset(self):
+    ScraperSingleton._upsertPage(self.url_path, [ColumnSelector.BRAND, ColumnSelector.WEIGHT], ["On Cloud"], [["On"], [8.1]])
+    ScraperSingleton._upsertPage(self.url_path, [ColumnSelector.WEIGHT], ["On Cloud", "Hoka Clifton 8"], [[8.3, 8.8]])
+    self.assertEqual(self.get_value("On Cloud", ColumnSelector.WEIGHT), Decimal("8.3"))
+    self.assertEqual(self.get_value("On Cloud", ColumnSelector.BRAND), "On")
+    self.assertIsNone(self.get_value("Hoka Clifton 8", ColumnSelector.BRAND))
+
+  def test_gender_membership(self):
+    ScraperSingleton._gender_membership = {"On Cloud": {Gender.MEN, Gender.WOMEN}}
+    self.addCleanup(setattr, ScraperSingleton, '_gender_membership', None)
+    ScraperSingleton._upsertPage(self.url_path, [ColumnSelector.BRAND], ["On Cloud", "Hoka Clifton 8"], [["On", "Hoka"]])
+    self.assertEqual(self.model.objects.get(shoe_name="On Cloud").gender, ['Men', 'Women'])
+    self.assertEqual(self.model.objects.get(shoe_name="Hoka Clifton 8").gender, [])
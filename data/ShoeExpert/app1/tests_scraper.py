@@ -0,0 +1,389 @@
+import contextlib
+import csv
+import functools
+import io
+import json
+import os
+import requests
+import shutil
+import tempfile
+import time
+from unittest import mock
+from aggregate import Backend, ColumnSelector, Gender, ScrapeSnapshot, ScraperPool, ScraperSingleton, SnapshotMode, Url_Paths
+from django.test import SimpleTestCase
+from scraper import _TabScheduler
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'test_fixtures')
+CATALOG_URL = f"https://runrepeat.com{Url_Paths.RUNNING_SHOES.get_url_path(gender=Gender.NONE)}"
+
+def read_fixture(filename: str):
+  with open(os.path.join(FIXTURE_DIR, filename), 'r') as f:
+    return f.read()
+
+def read_csv(filename: str):
+  with open(filename, 'r', newline='') as f:
+    return list(csv.reader(f))
+
+# Snapshot of an HTTP scrape of the running shoes catalog that serves the fixture page for pages
+# and ends the catalog after last_page, replayed without a browser or network access
+def replay_pages(directory: str, pages, last_page: int = None):
+  snapshot = ScrapeSnapshot(directory)
+  for page in pages:
+    snapshot.put(("http", f"{CATALOG_URL}?page={page}"), [200, read_fixture('running_shoes_page.html')])
+  if last_page is not None:
+    snapshot.put(("http", f"{CATALOG_URL}?page={last_page + 1}"), [404, ""])
+  return ScrapeSnapshot(directory, mode=SnapshotMode.REPLAY)
+
+def replay_scrape(filename: str, snapshot: ScrapeSnapshot, columnlist, **kwargs):
+  with contextlib.redirect_stderr(io.StringIO()):
+    ScraperSingleton.scrape(filename, url_path=Url_Paths.RUNNING_SHOES, backend=Backend.HTTP, snapshot=snapshot, columnlist=columnlist, **kwargs)
+
+class Catalog_Page_Test(SimpleTestCase):
+  def setUp(self):
+    self.url_path = Url_Paths.RUNNING_SHOES
+    self.parser = ScraperSingleton._parseCatalogPage(read_fixture('running_shoes_page.html'))
+
+  def serialize(self, column, texts):
+    return self.url_path.get_column_parser(column).parse(texts)
+
+  def test_parse_shoe_names(self):
+    self.assertEqual(self.parser.names, ["On Cloud", "Hoka Clifton 8", "Brooks Ghost 14"])
+
+  def test_parse_column_menu(self):
+    self.assertEqual(len(self.parser.states), len(self.url_path.get_available_columns()))
+    self.assertEqual(len([id for id, checked in self.parser.states if checked]), len(self.parser.facts))
+
+  def test_map_rendered_columns(self):
+    names, column_data = ScraperSingleton._mapCatalogPage(self.parser, self.url_path.get_available_columns())
+    self.assertEqual(len(names), 3)
+    self.assertEqual(column_data[ColumnSelector.SCORE], ["88", "90", "85"])
+    self.assertEqual(self.serialize(ColumnSelector.BRAND, column_data[ColumnSelector.BRAND]), ["On", "Hoka", "Brooks"])
+    self.assertEqual(self.serialize(ColumnSelector.WEIGHT, column_data[ColumnSelector.WEIGHT]), [8.1, 8.8, 9.9])
+    self.assertEqual(self.serialize(ColumnSelector.HEEL_TOE_DROP, column_data[ColumnSelector.HEEL_TOE_DROP]), [6.5, 6.5, 12.0])
+    self.assertEqual(self.serialize(ColumnSelector.RELEASE_DATE, column_data[ColumnSelector.RELEASE_DATE]), [None, 2021, 2022])
+    self.assertEqual(self.serialize(ColumnSelector.PRONATION, column_data[ColumnSelector.PRONATION]), ['{Supination, Underpronation, Neutral}', '{Neutral}', '{Overpronation, Severe Overpronation}'])
+
+  def test_tag_lists(self):
+    parser = self.url_path.get_column_parser(ColumnSelector.PRONATION)
+    texts = ['Severe overpronation, Overpronation', 'Neutral', 'Severe overpronation']
+    self.assertEqual(parser.parseLists(texts), [['Overpronation', 'Severe Overpronation'], ['Neutral'], ['Severe Overpronation']])
+    self.assertEqual(parser.parse(texts), ['{Overpronation, Severe Overpronation}', '{Neutral}', '{Severe Overpronation}'])
+
+  def test_unrendered_columns_are_missing(self):
+    _, column_data = ScraperSingleton._mapCatalogPage(self.parser, self.url_path.get_django_available_columns())
+    self.assertNotIn(ColumnSelector.MSRP, column_data)
+    self.assertNotIn(ColumnSelector.SCORE, column_data)
+
+  def test_page_without_column_menu(self):
+    html = read_fixture('running_shoes_page.html').replace('type="checkbox"', 'type="hidden"')
+    self.assertIsNone(ScraperSingleton._mapCatalogPage(ScraperSingleton._parseCatalogPage(html), self.url_path.get_available_columns()))
+
+  def test_page_without_shoes(self):
+    parser = ScraperSingleton._parseCatalogPage('<html><body><div class="catalog-list-slim"></div></body></html>')
+    self.assertEqual(parser.names, [])
+    self.assertIsNone(ScraperSingleton._mapCatalogPage(parser, self.url_path.get_available_columns()))
+
+# running_shoes_catalog.json is written by hand after the rendered fixture page, not captured from the site,
+# so these tests only keep the XHR backend consistent with the HTML one
+class Catalog_Json_Test(SimpleTestCase):
+  def setUp(self):
+    self.url_path = Url_Paths.RUNNING_SHOES
+    self.data = json.loads(read_fixture('running_shoes_catalog.json'))
+    self.parser = ScraperSingleton._parseCatalogPage(read_fixture('running_shoes_page.html'))
+
+  def serialize(self, column, texts):
+    return self.url_path.get_column_parser(column).parse(texts)
+
+  def test_find_products(self):
+    self.assertEqual(len(ScraperSingleton._findCatalogProducts(self.data)), 3)
+    self.assertIsNone(ScraperSingleton._findCatalogProducts({"data": {"filters": [{"values": []}]}}))
+
+  def test_matches_rendered_page(self):
+    columnlist = self.url_path.get_available_columns()
+    json_names, json_data = ScraperSingleton._mapCatalogJson(self.data, columnlist)
+    html_names, html_data = ScraperSingleton._mapCatalogPage(self.parser, columnlist)
+    self.assertEqual(json_names, html_names)
+    self.assertEqual(json_data.keys() - html_data.keys(), {ColumnSelector.MSRP})
+    for column in html_data:
+      self.assertEqual(self.serialize(column, json_data[column]), self.serialize(column, html_data[column]))
+
+  def test_facts_missing_from_a_product(self):
+    del self.data["data"]["products"][1]["facts"]["weight"]
+    _, column_data = ScraperSingleton._mapCatalogJson(self.data, [ColumnSelector.BRAND, ColumnSelector.WEIGHT])
+    self.assertEqual(list(column_data), [ColumnSelector.BRAND])
+
+  def test_response_without_products(self):
+    self.assertIsNone(ScraperSingleton._mapCatalogJson({"user": {"id": 1}}, self.url_path.get_available_columns()))
+
+class Catalog_Schema_Test(SimpleTestCase):
+  def setUp(self):
+    self.url_path = Url_Paths.TRAIL_SHOES
+
+  def test_parsers_built_on_first_use(self):
+    self.url_path._parsers = None
+    self.url_path.get_column_model(ColumnSelector.BRAND)
+    self.assertIsNone(self.url_path._parsers)
+    parser = self.url_path.get_column_parser(ColumnSelector.TOEBOX)
+    self.assertIs(self.url_path.get_column_parser(ColumnSelector.TOEBOX), parser)
+    self.assertEqual(parser.parse(['Extra wide', 'Wide', 'Narrow, Medium']), ['Extra Wide', 'Wide', 'Narrow'])
+
+  def test_fields_follow_schema(self):
+    for column in self.url_path.get_available_columns():
+      model = self.url_path.get_column_model(column)
+      self.assertEqual(model is not None, column in self.url_path.get_django_available_columns())
+      self.assertIs(self.url_path.get_column_model(column), model)
+    weight = self.url_path.get_column_model(ColumnSelector.WEIGHT)
+    self.assertEqual((weight.max_digits, weight.decimal_places, weight.null), (3, 1, True))
+    self.assertEqual([validator.limit_value for validator in weight.validators if hasattr(validator, 'limit_value')], [0])
+
+class Scraper_Pool_Test(SimpleTestCase):
+  def test_jobs_of_one_category_rejected(self):
+    jobs = [(Url_Paths.RUNNING_SHOES, Gender.NONE, range(1, 3)), (Url_Paths.RUNNING_SHOES, Gender.MEN, None), (Url_Paths.RUNNING_SHOES, Gender.NONE, range(3, 3))]
+    with mock.patch.object(ScraperPool, '_runJobs') as run_jobs:
+      with self.assertRaises(ValueError):
+        ScraperPool(workers=2).scrape(jobs, tempfile.gettempdir())
+      run_jobs.assert_not_called()
+
+  def test_shards(self):
+    self.assertEqual(ScraperPool._getShards(10, 3), [range(1, 5), range(5, 8), range(8, 8)])
+    # The last shard is left open so pages added since the count are still scraped
+    self.assertEqual(ScraperPool._getShards(0, 4), [range(1, 1)])
+    self.assertEqual(ScraperPool._getShards(1, 4), [range(1, 1)])
+    self.assertEqual(ScraperPool._getShards(3, 8), [range(1, 2), range(2, 3), range(3, 3)])
+
+  def write_part(self, directory: str, name: str, rows):
+    filename = os.path.join(directory, name)
+    with open(filename, 'w', newline='') as f:
+      csv.writer(f, lineterminator="\n").writerows(rows)
+    return filename
+
+  def test_merge_parts(self):
+    directory = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, directory)
+    parts = [self.write_part(directory, 'part_1.csv', [['SHOE_NAME', 'Brand'], ['On Cloud', 'On']]), self.write_part(directory, 'part_2.csv', [['SHOE_NAME', 'Brand']]), self.write_part(directory, 'part_3.csv', [['SHOE_NAME', 'Brand'], ['Hoka Clifton 8', 'Hoka'], ['Brooks Ghost 14', 'Brooks']])]
+    filename = os.path.join(directory, 'Running_Shoes.csv')
+    ScraperPool._mergeParts(parts, filename)
+    self.assertEqual(read_csv(filename), [['SHOE_NAME', 'Brand'], ['On Cloud', 'On'], ['Hoka Clifton 8', 'Hoka'], ['Brooks Ghost 14', 'Brooks']])
+
+  def test_merge_parts_with_other_header(self):
+    directory = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, directory)
+    parts = [self.write_part(directory, 'part_1.csv', [['SHOE_NAME', 'Brand'], ['On Cloud', 'On']]), self.write_part(directory, 'part_2.csv', [['SHOE_NAME', 'Weight (oz)'], ['Hoka Clifton 8', '8.8']])]
+    filename = os.path.join(directory, 'Running_Shoes.csv')
+    with self.assertRaises(ValueError):
+      ScraperPool._mergeParts(parts, filename)
+    self.assertFalse(os.path.exists(filename))
+
+class Page_Count_Test(SimpleTestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.directory)
+    self.addCleanup(ScraperSingleton._resetClassVariables)
+
+  def session(self, last_page: int):
+    def get(url, timeout):
+      page = int(url.rsplit('=', 1)[1])
+      return mock.Mock(status_code=200 if page <= last_page else 404, text=read_fixture('running_shoes_page.html') if page <= last_page else "")
+    return mock.Mock(get=mock.Mock(side_effect=get))
+
+  def test_count_over_http(self):
+    session = self.session(5)
+    with mock.patch.object(ScraperSingleton, '_url', CATALOG_URL), mock.patch.object(ScraperSingleton, '_getSession', return_value=session), mock.patch.object(ScraperSingleton, '_ensureBrowser', side_effect=AssertionError):
+      self.assertEqual(ScraperSingleton._countPagesOverHttp(), 5)
+    self.assertLessEqual(session.get.call_count, 2 * 3 + 1)
+
+  def test_failed_count_skips_browser(self):
+    session = mock.Mock(get=mock.Mock(side_effect=requests.ConnectionError))
+    with mock.patch.object(ScraperSingleton, '_url', CATALOG_URL), mock.patch.object(ScraperSingleton, '_getSession', return_value=session), mock.patch.object(ScraperSingleton, '_ensureBrowser', side_effect=AssertionError), contextlib.redirect_stderr(io.StringIO()):
+      self.assertIsNone(ScraperSingleton._countPagesOverHttp())
+    session.get.assert_called_once()
+
+  def test_known_page_count(self):
+    stderr = io.StringIO()
+    with mock.patch.object(ScraperSingleton, '_countPagesOverHttp', side_effect=AssertionError), contextlib.redirect_stderr(stderr):
+      ScraperSingleton.scrape(os.path.join(self.directory, 'Running_Shoes.csv'), url_path=Url_Paths.RUNNING_SHOES, backend=Backend.HTTP, snapshot=replay_pages(os.path.join(self.directory, 'snapshot'), range(2, 4), last_page=3), columnlist=[ColumnSelector.BRAND], pages=range(2, 2), page_count=3)
+    self.assertIn("page 2 (1/2)", stderr.getvalue())
+    self.assertIn("page 3 (2/2)", stderr.getvalue())
+
+  def test_category_shards_given_page_count(self):
+    with mock.patch.object(ScraperSingleton, 'getPageCount', return_value=10), mock.patch.object(ScraperPool, '_runJobs') as run_jobs, mock.patch.object(ScraperPool, '_mergeParts'), contextlib.redirect_stdout(io.StringIO()):
+      ScraperPool(workers=3).scrapeCategory(Url_Paths.RUNNING_SHOES, os.path.join(self.directory, 'Running_Shoes.csv'))
+    self.assertEqual([job_kwargs['page_count'] for job_kwargs in run_jobs.call_args[0][2]], [10, 10, 10])
+
+class Journal_Test(SimpleTestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.directory)
+    self.filename = os.path.join(self.directory, 'Running_Shoes.csv')
+    self.columnlist = [ColumnSelector.BRAND, ColumnSelector.WEIGHT, ColumnSelector.PRONATION]
+
+  def fail_at_page_3(self):
+    with self.assertRaises(RuntimeError):
+      replay_scrape(self.filename, replay_pages(os.path.join(self.directory, 'first'), range(1, 3)), self.columnlist)
+    self.assertTrue(os.path.exists(f"{self.filename}.journal"))
+    self.assertFalse(os.path.exists(self.filename))
+
+  def test_resume_after_failure(self):
+    self.fail_at_page_3()
+    # Pages 1 and 2 are no longer served, only the journal has them
+    replay_scrape(self.filename, replay_pages(os.path.join(self.directory, 'second'), [3], last_page=3), self.columnlist)
+    rows = read_csv(self.filename)
+    self.assertEqual(rows[0], ['SHOE_NAME', 'Brand', 'Weight (oz)', 'Pronation'])
+    self.assertEqual([row[0] for row in rows[1:]], ["On Cloud", "Hoka Clifton 8", "Brooks Ghost 14"] * 3)
+    self.assertFalse(os.path.exists(f"{self.filename}.journal"))
+
+  def test_expired_journal_discarded(self):
+    self.fail_at_page_3()
+    with mock.patch.object(ScraperSingleton, '_journal_max_age', 0):
+      with self.assertRaises(RuntimeError):
+        replay_scrape(self.filename, replay_pages(os.path.join(self.directory, 'second'), [3], last_page=3), self.columnlist)
+
+  def test_journal_of_other_columns_discarded(self):
+    self.fail_at_page_3()
+    with self.assertRaises(RuntimeError):
+      replay_scrape(self.filename, replay_pages(os.path.join(self.directory, 'second'), [3], last_page=3), self.columnlist[:2])
+
+class Backend_Test(SimpleTestCase):
+  def test_performance_log_only_for_xhr(self):
+    self.addCleanup(ScraperSingleton._resetClassVariables)
+    with mock.patch.object(ScraperSingleton, '_browser', None), mock.patch.object(ScraperSingleton, '_performance_log', False):
+      ScraperSingleton._setBackend(Backend.XHR)
+      self.assertTrue(ScraperSingleton._performance_log)
+      ScraperSingleton._setBackend(Backend.SELENIUM)
+      self.assertFalse(ScraperSingleton._performance_log)
+
+  def test_browser_restarted_without_performance_log(self):
+    self.addCleanup(ScraperSingleton._resetClassVariables)
+    with mock.patch.object(ScraperSingleton, '_browser', object()), mock.patch.object(ScraperSingleton, '_performance_log', True), mock.patch.object(ScraperSingleton, '_recycleBrowser') as recycle:
+      ScraperSingleton._setBackend(Backend.XHR)
+      recycle.assert_not_called()
+      ScraperSingleton._setBackend(Backend.HTTP)
+      recycle.assert_called_once()
+      self.assertFalse(ScraperSingleton._performance_log)
+
+class Merge_Test(SimpleTestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.directory)
+    self.filename = os.path.join(self.directory, 'Running_Shoes.csv')
+    with open(self.filename, 'w', newline='') as f:
+      writer = csv.writer(f, lineterminator="\n")
+      writer.writerow(['SHOE_NAME', 'Brand', 'Weight (oz)', 'Pronation'])
+      writer.writerow(['On Cloud', 'On', '9.9', '{Neutral}'])
+      writer.writerow(['Retired Shoe', 'Nike', '10.0', '{Neutral}'])
+
+  def test_merge_columns(self):
+    replay_scrape(self.filename, replay_pages(os.path.join(self.directory, 'snapshot'), [1], last_page=1), [ColumnSelector.WEIGHT, ColumnSelector.HEEL_TOE_DROP], merge=True)
+    drop = Url_Paths.RUNNING_SHOES.get_column_name(ColumnSelector.HEEL_TOE_DROP)
+    self.assertEqual(read_csv(self.filename), [
+      ['SHOE_NAME', 'Brand', 'Weight (oz)', 'Pronation', drop],
+      # Scraped columns are replaced, the others kept
+      ['On Cloud', 'On', '8.1', '{Neutral}', '6.5'],
+      # Shoes no longer listed are kept as they are
+      ['Retired Shoe', 'Nike', '10.0', '{Neutral}', ''],
+      # New shoes are appended with only the scraped columns
+      ['Hoka Clifton 8', '', '8.8', '', '6.5'],
+      ['Brooks Ghost 14', '', '9.9', '', '12.0']
+    ])
+    self.assertFalse(os.path.exists(f"{self.filename}.partial"))
+
+class Snapshot_Test(SimpleTestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.directory)
+
+  def put(self, snapshot: ScrapeSnapshot, key, value, age: float):
+    with mock.patch.object(time, 'time', return_value=time.time() - age):
+      snapshot.put(key, value)
+
+  def count_objects(self):
+    return sum(len(files) for _, _, files in os.walk(os.path.join(self.directory, 'objects')))
+
+  def test_identical_values_stored_once(self):
+    snapshot = ScrapeSnapshot(self.directory)
+    snapshot.put(("column", "a"), ["x"] * 10)
+    snapshot.put(("column", "b"), ["x"] * 10)
+    self.assertEqual(self.count_objects(), 1)
+    self.assertEqual(snapshot.get(("column", "b")), ["x"] * 10)
+
+  def test_expired_refs_missed_and_evicted(self):
+    snapshot = ScrapeSnapshot(self.directory, ttl=60)
+    self.put(snapshot, ("column", "old"), "x", 120)
+    self.put(snapshot, ("column", "new"), "y", 0)
+    with self.assertRaises(RuntimeError):
+      snapshot.get(("column", "old"))
+    self.assertEqual(snapshot.evict(), 1)
+    self.assertEqual(snapshot.get(("column", "new")), "y")
+    self.assertEqual(self.count_objects(), 1)
+
+  def test_oldest_refs_evicted_first(self):
+    snapshot = ScrapeSnapshot(self.directory, max_size=150)
+    self.put(snapshot, ("column", "a"), "x" * 100, 30)
+    self.put(snapshot, ("column", "b"), "y" * 100, 20)
+    self.put(snapshot, ("column", "c"), "x" * 100, 10)
+    # Dropping a alone frees nothing, its object is still referenced by c
+    self.assertEqual(snapshot.evict(), 2)
+    for key in ("a", "b"):
+      with self.assertRaises(RuntimeError):
+        snapshot.get(("column", key))
+    self.assertEqual(snapshot.get(("column", "c")), "x" * 100)
+    self.assertEqual(self.count_objects(), 1)
+
+  def test_replay_http_scrape(self):
+    url_path = Url_Paths.RUNNING_SHOES
+    parser = ScraperSingleton._parseCatalogPage(read_fixture('running_shoes_page.html'))
+    names, column_data = ScraperSingleton._mapCatalogPage(parser, url_path.get_available_columns())
+    columnlist = [column for column in url_path.get_available_columns() if column in column_data]
+    expected = io.StringIO()
+    writer = csv.writer(expected, lineterminator="\n")
+    writer.writerow(["SHOE_NAME"] + [url_path.get_column_name(column) for column in columnlist])
+    writer.writerows(list(zip(names, *[url_path.get_column_parser(column).parse(column_data[column]) for column in columnlist])) * 2)
+    filename = os.path.join(self.directory, 'Running_Shoes.csv')
+    snapshot = replay_pages(os.path.join(self.directory, 'snapshot'), range(1, 3), last_page=2)
+    # Nothing but the snapshot is read
+    with mock.patch.object(ScraperSingleton, '_ensureBrowser', side_effect=AssertionError), mock.patch.object(ScraperSingleton, '_getSession', side_effect=AssertionError):
+      replay_scrape(filename, snapshot, columnlist)
+    self.assertEqual(read_csv(filename), list(csv.reader(io.StringIO(expected.getvalue()))))
+    self.assertEqual(snapshot.reads, 3)
+
+class Tab_Scheduler_Test(SimpleTestCase):
+  def test_lanes_take_turns(self):
+    class Scraper:
+      _job = None
+      _tab_browser = None
+      _tab_lane = None
+      closed = 0
+
+      @classmethod
+      def _getScrapeDefaults(cls):
+        return {"_job": None}
+
+      @classmethod
+      def _closeLaneTab(cls):
+        cls.closed += 1
+
+    scheduler = _TabScheduler(Scraper, 2)
+    turns = []
+    running = []
+    mixed = []
+    def job(index):
+      Scraper._job = index
+      for _ in range(3):
+        running.append(index)
+        turns.append((index, len(running)))
+        running.remove(index)
+        scheduler.switch()
+        if Scraper._job != index:
+          mixed.append(index)
+      if index == 2:
+        raise ValueError("page 3 failed")
+      return index * 10
+    outcomes = {}
+    scheduler.run([functools.partial(job, index) for index in range(4)], lambda index, result, error: outcomes.setdefault(index, (result, error)))
+    self.assertEqual(max(count for _, count in turns), 1)
+    self.assertEqual([index for index, _ in turns[:2]], [0, 1])
+    self.assertEqual(mixed, [])
+    self.assertEqual({index: result for index, (result, error) in outcomes.items() if error is None}, {0: 0, 1: 10, 3: 30})
+    self.assertIsInstance(outcomes[2][1], ValueError)
+    self.assertEqual(Scraper.closed, 2)
+    self.assertIsNone(Scraper._job)
@@ -0,0 +1,38 @@
+import filecmp
+import os
+import tempfile
+import time
+
+from aggregate import Backend
+from aggregate import Url_Paths
+from aggregate import ScraperSingleton
+
+def main():
+    url_path = Url_Paths.RUNNING_SHOES
+    pages = range(1, 4)
+
+    directory = tempfile.mkdtemp()
+    filenames = {}
+    for backend in [Backend.SELENIUM, Backend.HTTP, Backend.XHR]:
+        filenames[backend] = os.path.join(directory, f"{backend.name.lower()}.csv")
+        start = time.perf_counter()
+        ScraperSingleton().scrape(
+            filename=filenames[backend],
+            url_path=url_path,
+            pages=pages,
+            sleep=0,
+            timeout=1,
+            backend=backend
+        )
+        elapsed = time.perf_counter() - start
+        print(f"{backend.name}: {len(pages)} pages in {elapsed:.2f}s ({len(pages) / elapsed * 60:.1f} pages/min)")
+
+    for backend in [Backend.HTTP, Backend.XHR]:
+        identical = filecmp.cmp(filenames[Backend.SELENIUM], filenames[backend], shallow=False)
+        print(f"CSV output of {backend.name} identical: {identical}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import time
+
+from aggregate import BlockedResource
+from aggregate import Url_Paths
+from aggregate import ScraperSingleton
+
+def main():
+    url_path = Url_Paths.RUNNING_SHOES
+    pages = range(1, 4)
+
+    directory = tempfile.mkdtemp()
+    profiles = {
+        "full": frozenset(),
+        "lean": frozenset(BlockedResource)
+    }
+    for profile, blocked_resources in profiles.items():
+        ScraperSingleton.configureBrowser(blocked_resources=blocked_resources)
+        start = time.perf_counter()
+        ScraperSingleton().scrape(
+            filename=os.path.join(directory, f"{profile}.csv"),
+            url_path=url_path,
+            pages=pages,
+            single_pass=True,
+            checkpoint=False
+        )
+        elapsed = time.perf_counter() - start
+        rss = ScraperSingleton.getBrowserMemory()
+        print(f"{profile}: {elapsed / len(pages):.2f}s per page, browser RSS {rss / 2**20:.0f} MiB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import csv
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+
+from aggregate import Url_Paths
+
+# The shipped CSVs hold serialized values, the units are added back so every parser sees text like the catalog's
+def get_column_texts(url_path, filename):
+    with open(filename, 'r') as f:
+        rows = list(csv.DictReader(f))
+    columns = {}
+    for column in url_path.get_django_available_columns():
+        name = url_path.get_column_name(column)
+        units = url_path.get_column_units(column)
+        texts = []
+        for row in rows:
+            value = row.get(name, '')
+            if value == '':
+                texts.append('N/A')
+            elif units == "USD":
+                texts.append(f"${value}")
+            elif units is not None:
+                texts.append(f"{value} {units}")
+            else:
+                texts.append(value)
+        columns[column] = texts
+    return columns
+
+# The per-cell lambdas the parsers replaced only exist in history: the aggregate.py given as the first argument, or
+# the last revision of .modules/aggregate.py that still had them when the script runs inside the git checkout
+def load_lambda_baseline(argv):
+    if len(argv) > 1:
+        with open(argv[1], 'r') as f:
+            source = f.read()
+    else:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        try:
+            revision = subprocess.run(["git", "log", "-1", "--format=%H", "-S", "lambda_serializer", "--", ":/.modules/aggregate.py"], cwd=directory, capture_output=True, text=True, check=True).stdout.strip()
+            source = subprocess.run(["git", "show", f"{revision}~1:.modules/aggregate.py"], cwd=directory, capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader("aggregate_lambdas", loader=None))
+    exec(compile(source, "aggregate_lambdas", "exec"), module.__dict__)
+    return module
+
+def main():
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "static", "shoe_data")
+    baseline = load_lambda_baseline(sys.argv)
+    if baseline is None:
+        print("No aggregate.py with the per-cell lambdas, pass one as the first argument to compare against them", file=sys.stderr)
+    cells = 0
+    lambdas = 0.0
+    per_cell = 0.0
+    batch = 0.0
+    for url_path in Url_Paths:
+        filename = os.path.join(directory, f"{url_path.name.title()}.csv")
+        if not os.path.exists(filename):
+            continue
+        for column, texts in get_column_texts(url_path, filename).items():
+            parser = url_path.get_column_parser(column)
+            start = time.perf_counter()
+            expected = [parser(text) for text in texts]
+            per_cell += time.perf_counter() - start
+            start = time.perf_counter()
+            values = parser.parse(texts)
+            batch += time.perf_counter() - start
+            if values != expected:
+                print(f"{url_path.name} {column.name}: batch and per cell values differ")
+            if baseline is not None:
+                serializer = baseline.Url_Paths[url_path.name].get_column_lambda(baseline.ColumnSelector[column.name])
+                start = time.perf_counter()
+                previous = [serializer(text) for text in texts]
+                lambdas += time.perf_counter() - start
+                if previous != expected:
+                    print(f"{url_path.name} {column.name}: parser and lambda values differ")
+            cells += len(texts)
+
+    if baseline is not None:
+        print(f"{cells} cells: lambdas {lambdas * 1000:.1f}ms, parser per cell {per_cell * 1000:.1f}ms, batch {batch * 1000:.1f}ms ({lambdas / batch:.1f}x over the lambdas)")
+    else:
+        print(f"{cells} cells: parser per cell {per_cell * 1000:.1f}ms, batch {batch * 1000:.1f}ms ({per_cell / batch:.1f}x)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
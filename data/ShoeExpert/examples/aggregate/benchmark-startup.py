@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+
+# Each case is (setup, statements) run in a fresh interpreter in the project directory, only the statements are timed
+CASES = {
+    "manage.py check": ("", """
+import runpy
+sys.argv = ["manage.py", "check"]
+try:
+    runpy.run_path("manage.py", run_name="__main__")
+except SystemExit:
+    pass
+"""),
+    # What a web worker does before its first response: load every app, then the URLconf
+    "web worker": ("", """
+from ShoeExpert.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+"""),
+    # What a ScraperPool worker does before its first page: load every app, then the scraper and its category's parsers
+    "scraper worker": ("", """
+import django
+django.setup()
+from aggregate import Url_Paths
+import scraper
+for column in Url_Paths.RUNNING_SHOES.get_available_columns():
+    Url_Paths.RUNNING_SHOES.get_column_parser(column)
+"""),
+    # The share of the above spent on the catalog schema: every category's fields, which app1.models builds, and the
+    # parsers of one category
+    "catalog schema": ("import django.contrib.postgres.fields", """
+from aggregate import Url_Paths
+for url_path in Url_Paths:
+    for column in url_path.get_django_available_columns():
+        url_path.get_column_model(column)
+for column in Url_Paths.RUNNING_SHOES.get_available_columns():
+    Url_Paths.RUNNING_SHOES.get_column_parser(column)
+"""),
+}
+
+PROBE = """
+import os, resource, sys, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ShoeExpert.settings")
+sys.path.insert(0, os.getcwd())
+{setup}
+start = time.perf_counter()
+{statements}
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def measure(setup, statements, directory, repeat):
+    times = []
+    rss = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(setup=setup, statements=statements)], cwd=directory, capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[-2]))
+        rss.append(int(output[-1]))
+    return min(times), min(rss)
+
+def main():
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for name, (setup, statements) in CASES.items():
+        elapsed, rss = measure(setup, statements, directory, repeat)
+        print(f"{name}: {elapsed * 1000:.1f}ms, peak rss {rss / 1024:.1f}MB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import filecmp
+import os
+import tempfile
+import time
+
+from aggregate import Gender, Url_Paths
+from aggregate import ScraperPool, ScraperSingleton
+
+def main():
+    url_path = Url_Paths.RUNNING_SHOES
+    pages = range(1, 7)
+
+    directory = tempfile.mkdtemp()
+    filenames = {}
+    for tabs in [1, 3]:
+        filenames[tabs] = os.path.join(directory, f"tabs_{tabs}.csv")
+        start = time.perf_counter()
+        ScraperSingleton().scrape(
+            filename=filenames[tabs],
+            url_path=url_path,
+            pages=pages,
+            single_pass=True,
+            checkpoint=False,
+            tabs=tabs
+        )
+        elapsed = time.perf_counter() - start
+        rss = ScraperSingleton.getBrowserMemory()
+        print(f"{tabs} tabs: {len(pages) / elapsed * 60:.1f} pages/min, browser RSS {rss / 2**20:.0f} MiB")
+
+    identical = filecmp.cmp(filenames[1], filenames[3], shallow=False)
+    print(f"CSV output identical: {identical}")
+
+    # The same categories one after the other, then each in a tab of its own
+    jobs = [(url_path, Gender.NONE, pages) for url_path in [Url_Paths.RUNNING_SHOES, Url_Paths.TRAIL_SHOES, Url_Paths.WALKING_SHOES]]
+    directories = {}
+    for tabs in [False, True]:
+        directories[tabs] = os.path.join(directory, "lanes" if tabs else "sequential")
+        start = time.perf_counter()
+        if tabs:
+            ScraperPool(workers=len(jobs), tabs=True).scrape(jobs, directories[tabs], single_pass=True, checkpoint=False)
+        else:
+            for job_url_path, gender, job_pages in jobs:
+                ScraperSingleton().scrape(
+                    filename=ScraperPool.getFilename(directories[tabs], job_url_path, gender),
+                    url_path=job_url_path,
+                    gender=gender,
+                    pages=job_pages,
+                    single_pass=True,
+                    checkpoint=False
+                )
+        elapsed = time.perf_counter() - start
+        rss = ScraperSingleton.getBrowserMemory()
+        print(f"{len(jobs)} categories {'in tabs' if tabs else 'one by one'}: {len(jobs) * len(pages) / elapsed * 60:.1f} pages/min, browser RSS {rss / 2**20:.0f} MiB")
+
+    identical = all(filecmp.cmp(ScraperPool.getFilename(directories[False], job_url_path, gender), ScraperPool.getFilename(directories[True], job_url_path, gender), shallow=False) for job_url_path, gender, _ in jobs)
+    print(f"CSV output identical: {identical}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+# Each import runs in a fresh interpreter so nothing is already cached in sys.modules
+IMPORTS = {
+    "schema": "import aggregate",
+    "scraper": "import scraper",
+}
+
+PROBE = """
+import resource, sys, time
+import django
+from django.conf import settings
+settings.configure()
+django.setup()
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = [name for name in ("selenium", "requests") if name in sys.modules]
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, ",".join(loaded))
+"""
+
+def measure(statement, repeat):
+    times = []
+    rss = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)], capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        rss.append(int(output[1]))
+        loaded = output[2] if len(output) > 2 else "-"
+    return min(times), min(rss), loaded
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for name, statement in IMPORTS.items():
+        elapsed, rss, loaded = measure(statement, repeat)
+        print(f"{name}: import {elapsed * 1000:.1f}ms, peak rss {rss / 1024:.1f}MB, loaded {loaded}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
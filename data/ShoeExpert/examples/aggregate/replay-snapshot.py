@@ -0,0 +1,36 @@
+import os
+import tempfile
+import time
+
+from aggregate import ScrapeSnapshot
+from aggregate import SnapshotMode
+from aggregate import Url_Paths
+from aggregate import ScraperSingleton
+
+def main():
+    url_path = Url_Paths.RUNNING_SHOES
+    pages = range(1, 4)
+
+    directory = tempfile.mkdtemp()
+    snapshot_directory = os.path.join(directory, "snapshot")
+
+    # Record once from the live site, then iterate on the serializers offline
+    modes = [SnapshotMode.RECORD, SnapshotMode.REPLAY, SnapshotMode.REPLAY]
+    for run, mode in enumerate(modes):
+        start = time.perf_counter()
+        ScraperSingleton().scrape(
+            filename=os.path.join(directory, f"{run}_{mode.name.lower()}.csv"),
+            url_path=url_path,
+            pages=pages,
+            single_pass=True,
+            checkpoint=False,
+            snapshot=ScrapeSnapshot(snapshot_directory, mode=mode, max_size=256 * 2**20)
+        )
+        elapsed = time.perf_counter() - start
+        print(f"{mode.name}: {len(pages)} pages in {elapsed:.2f}s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
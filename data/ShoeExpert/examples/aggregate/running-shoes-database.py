@@ -0,0 +1,30 @@
+import os
+import sys
+
+import django
+
+# The app1 models are only registered once the project's settings are loaded and its apps set up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ShoeExpert.settings")
+django.setup()
+
+from aggregate import Url_Paths
+from aggregate import ScraperSingleton
+
+def main():
+
+    url_path = Url_Paths.RUNNING_SHOES
+
+    ScraperSingleton().scrape(
+        filename=None,              # No CSV, every page is upserted into the Running_Shoes table as it is scraped
+        url_path=url_path,
+        pages=range(1, 3),
+        single_pass=True,
+        database=True
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
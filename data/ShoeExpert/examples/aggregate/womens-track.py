@@ -15,7 +15,7 @@ def main():
 
     # ScraperSingleton.scrape() defaults `columnlist` to None (All Available Columns Included)
         # Url_Paths defines an instance method get_available_columns():
-            # This method returns a list of all available columns
+            # This method returns a tuple of all available columns
             # Using TRACK_SHOES as an example: `Url_Paths.TRACK_SHOES.get_available_columns()`
     # Note: Including a column in the `columnlist` that is NOT available is an exceptional case
     columnlist = [
@@ -40,12 +40,24 @@ def main():
     # The following range expands to [1, 3, 5]
     pages = range(1, 7, 2)
 
-    # ScraperSingleton.scrape() defaults `sleep` to 0.5 seconds (slow w/ many pages)
+    # ScraperSingleton.scrape() defaults `sleep` to 0 seconds
+        # clicks that change the table already wait until it has been re-rendered
+        # any other value adds a fixed delay after every click (slow w/ many pages)
     sleep = 0
 
     # ScraperSingleton.scrape() defaults `timeout` to 10 seconds
     timeout = 1
 
+    # ScraperSingleton.scrape() defaults `single_pass` to False (one column at a time)
+        # True enables every column at once and reads the whole table per page
+        # Falls back to one column at a time for any page that cannot be read in a single pass
+    single_pass = True
+
+    # ScraperSingleton.scrape() defaults `merge` to False (the CSV is rewritten with only `columnlist`)
+        # True replaces only the `columnlist` columns of the shoes found in an existing CSV
+        # e.g. refreshing MSRP alone: columnlist=[ColumnSelector.MSRP], merge=True
+    merge = False
+
     ScraperSingleton().scrape(
         filename=filename,
         columnlist=columnlist,
@@ -53,7 +65,9 @@ def main():
         gender=gender,
         pages=pages,
         sleep=sleep,
-        timeout=timeout
+        timeout=timeout,
+        single_pass=single_pass,
+        merge=merge
     )
 
     return 0
@@ -1,13 +1,13 @@
-from aggregate import ColumnSelector, Gender, Url_Paths, ScraperSingleton
+from aggregate import ColumnSelector, Gender, Url_Paths, ScraperPool
 
 def main():
-  for url_path in [Url_Paths.RUNNING_SHOES, Url_Paths.TRAIL_SHOES, Url_Paths.TRAINING_SHOES]:
-    # FIXME:
-    filename = f"/home/mkapral/GitHub/Shoe-Expert/data/ShoeExpert/static/shoe_data/{url_path.name.title()}.csv"
-    ScraperSingleton().scrape(
-        filename = filename,
-        url_path=url_path
-    )
+  # FIXME:
+  directory = "/home/mkapral/GitHub/Shoe-Expert/data/ShoeExpert/static/shoe_data"
+  # One headless browser per worker process, defaults to one worker per core
+  ScraperPool().scrape(
+    jobs=[(url_path, Gender.NONE, None) for url_path in Url_Paths],
+    directory=directory
+  )
 
 if __name__ == "__main__":
     main()